@@ -6,7 +6,9 @@ Uses wait/notify mechanism for thread synchronization.
 """
 
 import threading
-from typing import Generic, TypeVar, Optional
+import time
+from collections import deque
+from typing import Generic, List, TypeVar, Optional
 
 T = TypeVar('T')
 
@@ -19,9 +21,17 @@ class BoundedBlockingQueue(Generic[T]):
     will block until space is available. When the queue is empty, consumers
     will block until items are available.
     
-    Uses Python's threading.Condition for wait/notify synchronization.
+    Uses two threading.Condition objects sharing a single lock for
+    wait/notify synchronization: producers wait on ``not_full`` and
+    consumers wait on ``not_empty``, so a wakeup only ever reaches the
+    side that can make progress.
+    
+    Instance attributes live in fixed __slots__ rather than a per-instance
+    dict, so the hot put/get paths read them at fixed offsets.
     """
     
+    __slots__ = ('_capacity', '_queue', '_mutex', '_not_full', '_not_empty', '_drained')
+    
     def __init__(self, capacity: int):
         """
         Initialize the bounded blocking queue.
@@ -37,9 +47,11 @@ class BoundedBlockingQueue(Generic[T]):
             raise ValueError("Capacity must be a positive integer")
         
         self._capacity = capacity
-        self._queue: list[T] = []
-        self._lock = threading.Condition()
-        self._size = 0
+        self._queue: deque[T] = deque()
+        self._mutex = threading.Lock()
+        self._not_full = threading.Condition(self._mutex)
+        self._not_empty = threading.Condition(self._mutex)
+        self._drained = threading.Condition(self._mutex)
     
     def put(self, item: T, timeout: Optional[float] = None) -> bool:
         """
@@ -58,21 +70,27 @@ class BoundedBlockingQueue(Generic[T]):
         Raises:
             RuntimeError: If timeout occurs.
         """
-        with self._lock:
-            # Wait until there's space in the queue
-            while self._size >= self._capacity:
-                if timeout is None:
-                    self._lock.wait()
-                else:
-                    if not self._lock.wait(timeout):
+        with self._not_full:
+            # Wait until there's space in the queue. The timeout is a
+            # deadline for the whole call, not per wakeup.
+            if timeout is None:
+                while len(self._queue) >= self._capacity:
+                    self._not_full.wait()
+            else:
+                deadline = time.monotonic() + timeout
+                while len(self._queue) >= self._capacity:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
                         raise RuntimeError("Timeout waiting to put item in queue")
+                    self._not_full.wait(remaining)
             
             # Add item to queue
             self._queue.append(item)
-            self._size += 1
             
-            # Notify waiting consumers
-            self._lock.notify()
+            # Wake one consumer per item added. Every item is matched by a
+            # notify(), so no waiting consumer is stranded, and no others
+            # are woken only to find the queue empty again.
+            self._not_empty.notify()
             return True
     
     def get(self, timeout: Optional[float] = None) -> T:
@@ -91,32 +109,190 @@ class BoundedBlockingQueue(Generic[T]):
         Raises:
             RuntimeError: If timeout occurs.
         """
-        with self._lock:
-            # Wait until there's an item in the queue
-            while self._size == 0:
-                if timeout is None:
-                    self._lock.wait()
-                else:
-                    if not self._lock.wait(timeout):
+        with self._not_empty:
+            # Wait until there's an item in the queue. The timeout is a
+            # deadline for the whole call, not per wakeup.
+            if timeout is None:
+                while not self._queue:
+                    self._not_empty.wait()
+            else:
+                deadline = time.monotonic() + timeout
+                while not self._queue:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
                         raise RuntimeError("Timeout waiting to get item from queue")
+                    self._not_empty.wait(remaining)
             
             # Remove and return item
-            item = self._queue.pop(0)
-            self._size -= 1
+            item = self._queue.popleft()
             
-            # Notify waiting producers
-            self._lock.notify()
+            # Wake one producer for the slot just freed
+            self._not_full.notify()
+            if not self._queue:
+                self._drained.notify_all()
             return item
     
+    def put_many(self, items: List[T], timeout: Optional[float] = None) -> int:
+        """
+        Add several items to the queue under a single lock acquisition.
+        
+        Items are added in order, as many at a time as there is free space.
+        If the queue fills up, this method blocks until space becomes
+        available or timeout occurs.
+        
+        Args:
+            items: The items to add to the queue.
+            timeout: Maximum time to wait in seconds for the whole batch.
+                     None means wait indefinitely.
+        
+        Returns:
+            Number of items added.
+        
+        Raises:
+            RuntimeError: If timeout occurs. Items added before the
+                         timeout remain in the queue.
+        """
+        added = 0
+        with self._not_full:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while added < len(items):
+                # Wait until there's space in the queue
+                while len(self._queue) >= self._capacity:
+                    if deadline is None:
+                        self._not_full.wait()
+                    else:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise RuntimeError("Timeout waiting to put items in queue")
+                        self._not_full.wait(remaining)
+                
+                # Fill the free space in one go
+                chunk = items[added:added + self._capacity - len(self._queue)]
+                self._queue.extend(chunk)
+                added += len(chunk)
+                
+                # Wake one consumer per item added
+                self._not_empty.notify(len(chunk))
+        return added
+    
+    def get_many(
+        self,
+        max_items: int,
+        timeout: Optional[float] = None,
+        stop_event: Optional[threading.Event] = None,
+        stop_at: Optional[T] = None
+    ) -> List[T]:
+        """
+        Remove and return up to max_items items under a single lock acquisition.
+        
+        If the queue is empty, this method will block until at least one
+        item becomes available, stop_event is set, or timeout occurs. It
+        never waits for more items once one is available.
+        
+        Args:
+            max_items: Maximum number of items to remove. Must be positive.
+            timeout: Maximum time to wait in seconds. None means wait indefinitely.
+            stop_event: Optional event that ends the wait early. It is
+                       checked whenever the queue is empty, so whoever sets
+                       it should call wakeup_all() to wake a blocked caller.
+            stop_at: Optional item (matched by identity) that ends the
+                    batch: it is the last item removed, and anything after
+                    it stays in the queue, e.g. for another consumer.
+        
+        Returns:
+            List of removed items, oldest first. Empty if stop_event was
+            set while the queue was empty.
+        
+        Raises:
+            ValueError: If max_items is not positive.
+            RuntimeError: If timeout occurs.
+        """
+        if max_items <= 0:
+            raise ValueError("max_items must be a positive integer")
+        
+        with self._not_empty:
+            # Wait until there's an item in the queue or a stop is requested
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while not self._queue:
+                if stop_event is not None and stop_event.is_set():
+                    return []
+                if deadline is None:
+                    self._not_empty.wait()
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise RuntimeError("Timeout waiting to get items from queue")
+                    self._not_empty.wait(remaining)
+            
+            count = min(max_items, len(self._queue))
+            popleft = self._queue.popleft
+            if stop_at is None:
+                items = [popleft() for _ in range(count)]
+            else:
+                items = []
+                for _ in range(count):
+                    item = popleft()
+                    items.append(item)
+                    if item is stop_at:
+                        break
+                count = len(items)
+            
+            # Wake one producer per slot freed
+            self._not_full.notify(count)
+            if not self._queue:
+                self._drained.notify_all()
+            return items
+    
+    def wakeup_all(self) -> None:
+        """
+        Wake every thread blocked waiting for an item.
+        
+        Woken threads recheck the queue and their stop_event, so this is
+        how a stop request reaches a consumer blocked in get_many().
+        Threads with nothing to do simply wait again.
+        """
+        with self._not_empty:
+            self._not_empty.notify_all()
+    
+    def join(self, timeout: Optional[float] = None) -> None:
+        """
+        Block until the queue is empty.
+        
+        Returns as soon as consumers have taken every item, which lets a
+        caller wait for the queue to drain instead of sleeping. Items a
+        consumer has taken but not yet finished processing are not
+        tracked; join the consumer thread for that.
+        
+        Args:
+            timeout: Maximum time to wait in seconds. None means wait indefinitely.
+        
+        Raises:
+            RuntimeError: If timeout occurs.
+        """
+        with self._drained:
+            if timeout is None:
+                while self._queue:
+                    self._drained.wait()
+            else:
+                deadline = time.monotonic() + timeout
+                while self._queue:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise RuntimeError("Timeout waiting for queue to drain")
+                    self._drained.wait(remaining)
+    
     def size(self) -> int:
         """
         Get the current number of items in the queue.
         
+        Reads without the lock: len() of a deque is atomic under the GIL.
+        Like the checks below, the result is a snapshot that another
+        thread may change before the caller acts on it.
+        
         Returns:
             Current queue size.
         """
-        with self._lock:
-            return self._size
+        return len(self._queue)
     
     def capacity(self) -> int:
         """
@@ -134,8 +310,7 @@ class BoundedBlockingQueue(Generic[T]):
         Returns:
             True if queue is empty, False otherwise.
         """
-        with self._lock:
-            return self._size == 0
+        return not self._queue
     
     def is_full(self) -> bool:
         """
@@ -144,6 +319,5 @@ class BoundedBlockingQueue(Generic[T]):
         Returns:
             True if queue is full, False otherwise.
         """
-        with self._lock:
-            return self._size >= self._capacity
+        return len(self._queue) >= self._capacity
 
@@ -7,7 +7,7 @@ and stores them in a destination container.
 
 import threading
 import time
-from typing import Generic, TypeVar
+from typing import Generic, List, Optional, TypeVar
 
 from bounded_blocking_queue import BoundedBlockingQueue
 from destination_container import DestinationContainer
@@ -24,13 +24,18 @@ class Consumer(threading.Thread, Generic[T]):
     a sentinel value indicating no more items will be produced.
     """
     
+    # Batch size used when none is given and there is no per-item delay
+    DEFAULT_BATCH_SIZE = 8
+    
     def __init__(
         self,
         queue: BoundedBlockingQueue[T],
         destination: DestinationContainer[T],
         name: str = "Consumer",
         delay: float = 0.0,
-        sentinel: T = None
+        sentinel: Optional[T] = None,
+        batch_size: Optional[int] = None,
+        verbose: bool = True
     ):
         """
         Initialize the consumer thread.
@@ -40,24 +45,48 @@ class Consumer(threading.Thread, Generic[T]):
             destination: Destination container to store items.
             name: Name of the consumer thread.
             delay: Optional delay between consuming items (in seconds).
-            sentinel: Sentinel value to indicate end of production.
-                     When this value is received, consumer will stop.
+            sentinel: Sentinel object to indicate end of production.
+                     When this exact object is received, consumer will
+                     stop. It is matched by identity, so use a dedicated
+                     object (e.g. ``object()``) rather than a value that
+                     could also appear in the data.
+            batch_size: Maximum number of items to take from the queue
+                       with a single get_many() call. Defaults to
+                       DEFAULT_BATCH_SIZE when delay is 0, and to 1
+                       otherwise so a slow consumer does not hold items
+                       other consumers could be processing.
+            verbose: Whether to print progress messages. Errors are
+                    always printed.
+        
+        Raises:
+            ValueError: If batch_size is not positive.
         """
+        if batch_size is None:
+            batch_size = self.DEFAULT_BATCH_SIZE if delay == 0 else 1
+        if batch_size <= 0:
+            raise ValueError("Batch size must be a positive integer")
+        
         super().__init__(name=name, daemon=False)
         self._queue = queue
         self._destination = destination
         self._delay = delay
         self._sentinel = sentinel
+        self._batch_size = batch_size
+        self._verbose = verbose
+        # Only this thread writes the counter; readers either run after
+        # join() or accept a value that may be one item behind.
         self._items_consumed = 0
-        self._lock = threading.Lock()
-        self._stop_requested = False
+        self._stop_event = threading.Event()
     
     def request_stop(self) -> None:
         """
         Request the consumer to stop after processing current items.
+        
+        Also wakes the consumer if it is blocked waiting on an empty
+        queue, so no sentinel is needed to unblock it.
         """
-        with self._lock:
-            self._stop_requested = True
+        self._stop_event.set()
+        self._queue.wakeup_all()
     
     def run(self) -> None:
         """
@@ -66,40 +95,78 @@ class Consumer(threading.Thread, Generic[T]):
         Reads items from the shared queue and stores them in the
         destination container until stop is requested or sentinel is received.
         """
-        print(f"[{self.name}] Started consuming items")
+        if self._verbose:
+            print(f"[{self.name}] Started consuming items")
+        
+        # Hoist attribute and method lookups out of the loop
+        stop_event = self._stop_event
+        stop_requested = stop_event.is_set
+        get_many = self._queue.get_many
+        consume_batch = self._consume_batch
+        batch_size = self._batch_size
+        sentinel = self._sentinel
         
         while True:
             # Check if stop was requested
-            with self._lock:
-                if self._stop_requested:
-                    break
+            if stop_requested():
+                break
             
             try:
-                # Get item from queue (will block if queue is empty)
-                item = self._queue.get()
+                # Get items from queue (will block if queue is empty, until
+                # items arrive or stop is requested)
+                batch = get_many(batch_size, stop_event=stop_event, stop_at=sentinel)
                 
-                # Check for sentinel value
-                if self._sentinel is not None and item == self._sentinel:
-                    print(f"[{self.name}] Received sentinel, stopping")
+                # An empty batch means stop was requested while waiting
+                if not batch or not consume_batch(batch):
                     break
-                
-                # Store item in destination
-                self._destination.add(item)
-                
-                with self._lock:
-                    self._items_consumed += 1
-                
-                print(f"[{self.name}] Consumed item: {item}")
-                
-                # Optional delay to simulate processing time
-                if self._delay > 0:
-                    time.sleep(self._delay)
             
             except Exception as e:
                 print(f"[{self.name}] Error consuming item: {e}")
                 break
         
-        print(f"[{self.name}] Finished consuming. Total items consumed: {self.get_items_consumed()}")
+        if self._verbose:
+            print(f"[{self.name}] Finished consuming. Total items consumed: {self.get_items_consumed()}")
+    
+    def _consume_batch(self, batch: List[T]) -> bool:
+        """
+        Store a batch of items taken from the queue.
+        
+        The queue ends a batch at the sentinel, so the sentinel can only
+        be the last item; anything after it was left in the queue, in
+        order, for other consumers.
+        
+        Args:
+            batch: Items taken from the queue, oldest first.
+        
+        Returns:
+            False if the sentinel was received, True otherwise.
+        """
+        # Hoist attribute and method lookups out of the per-item loop
+        add = self._destination.add
+        sentinel = self._sentinel
+        verbose = self._verbose
+        delay = self._delay
+        
+        for item in batch:
+            # Check for sentinel value
+            if sentinel is not None and item is sentinel:
+                if verbose:
+                    print(f"[{self.name}] Received sentinel, stopping")
+                return False
+            
+            # Store item in destination
+            add(item)
+            
+            self._items_consumed += 1
+            
+            if verbose:
+                print(f"[{self.name}] Consumed item: {item}")
+            
+            # Optional delay to simulate processing time
+            if delay > 0:
+                time.sleep(delay)
+        
+        return True
     
     def get_items_consumed(self) -> int:
         """
@@ -108,6 +175,5 @@ class Consumer(threading.Thread, Generic[T]):
         Returns:
             Number of items consumed.
         """
-        with self._lock:
-            return self._items_consumed
+        return self._items_consumed
 
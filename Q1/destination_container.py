@@ -4,8 +4,8 @@ Destination Container Implementation
 A container that stores items consumed from the queue.
 """
 
-import threading
-from typing import List, Generic, TypeVar
+from collections import deque
+from typing import Deque, Generic, List, TypeVar
 
 T = TypeVar('T')
 
@@ -14,14 +14,19 @@ class DestinationContainer(Generic[T]):
     """
     A container that stores items consumed from the queue.
     
-    This container is thread-safe and provides methods to add items
-    and retrieve all stored items.
+    Provides methods to add items and retrieve all stored items.
+    
+    There is no lock: items are kept in a deque, and the container is
+    safe to share between threads only because, under CPython's GIL,
+    deque.append() and copying a deque into a list each run as a single
+    C call that no other thread can interleave with. Concurrent consumers
+    can therefore add while another thread reads. This guarantee does not
+    hold on interpreters without a GIL.
     """
     
     def __init__(self):
         """Initialize an empty destination container."""
-        self._items: List[T] = []
-        self._lock = threading.Lock()
+        self._items: Deque[T] = deque()
     
     def add(self, item: T) -> None:
         """
@@ -30,18 +35,17 @@ class DestinationContainer(Generic[T]):
         Args:
             item: The item to add.
         """
-        with self._lock:
-            self._items.append(item)
+        self._items.append(item)
     
     def get_all_items(self) -> List[T]:
         """
         Get all items stored in the container.
         
         Returns:
-            List of all items in the container.
+            List of all items in the container. Each call returns a new
+            list, so callers may modify it.
         """
-        with self._lock:
-            return self._items.copy()
+        return list(self._items)
     
     def size(self) -> int:
         """
@@ -50,13 +54,10 @@ class DestinationContainer(Generic[T]):
         Returns:
             Number of items in the container.
         """
-        with self._lock:
-            return len(self._items)
+        return len(self._items)
     
     def clear(self) -> None:
         """
         Clear all items from the container.
         """
-        with self._lock:
-            self._items.clear()
-
+        self._items = deque()
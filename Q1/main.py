@@ -27,6 +27,7 @@ def main():
     source_items = [f"Item-{i}" for i in range(1, 21)]  # 20 items
     producer_delay = 0.1  # 100ms delay between producing items
     consumer_delay = 0.15  # 150ms delay between consuming items
+    sentinel = object()  # Unique end-of-production marker, matched by identity
     
     print(f"Configuration:")
     print(f"  Queue Capacity: {queue_capacity}")
@@ -38,7 +39,7 @@ def main():
     # Create components
     print("Creating components...")
     queue = BoundedBlockingQueue[str](queue_capacity)
-    source = SourceContainer[str](source_items)
+    source = SourceContainer[str](source_items, copy=False)
     destination = DestinationContainer[str]()
     
     print(f"  Queue created with capacity: {queue.capacity()}")
@@ -52,7 +53,8 @@ def main():
         source=source,
         queue=queue,
         name="Producer-1",
-        delay=producer_delay
+        delay=producer_delay,
+        sentinel=sentinel
     )
     
     consumer = Consumer(
@@ -60,7 +62,7 @@ def main():
         destination=destination,
         name="Consumer-1",
         delay=consumer_delay,
-        sentinel="STOP"
+        sentinel=sentinel
     )
     
     print(f"  Producer thread created: {producer.name}")
@@ -73,35 +75,13 @@ def main():
     consumer.start()
     producer.start()
     
-    # Wait for producer to finish
+    # Wait for producer to finish; it puts the sentinel when done
     producer.join()
     print("-" * 60)
     print(f"Producer thread finished")
     
-    # Wait a bit to ensure all items are consumed
-    import time
-    time.sleep(0.5)
-    
-    # If queue is not empty, wait for consumer to finish consuming items
-    while queue.size() > 0:
-        time.sleep(0.1)
-    
-    # Put a sentinel value to signal consumer to stop
-    # This will wake up consumer if it's waiting for items
-    try:
-        queue.put("STOP", timeout=0.1)
-    except:
-        pass
-    
     # Wait for consumer to finish (it will stop when it receives the sentinel)
     consumer.join()
-    
-    # Remove sentinel from queue if it's still there (consumer doesn't store it)
-    if queue.size() > 0:
-        try:
-            queue.get(timeout=0.1)
-        except:
-            pass
     print(f"Consumer thread finished")
     print()
     
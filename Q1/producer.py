@@ -7,7 +7,7 @@ into a shared blocking queue.
 
 import threading
 import time
-from typing import Generic, TypeVar
+from typing import Generic, List, Optional, TypeVar
 
 from bounded_blocking_queue import BoundedBlockingQueue
 from source_container import SourceContainer
@@ -22,14 +22,25 @@ class Producer(threading.Thread, Generic[T]):
     
     The producer will continue reading items until the source
     container is empty.
+    
+    Items are read from the source a batch at a time and published with
+    one put_many() call per batch, so both the source and the shared
+    queue are visited once per batch rather than once per item.
+    None entries in the source are skipped and never reach the queue.
     """
     
+    # Batch size used when none is given and there is no per-item delay
+    DEFAULT_BATCH_SIZE = 8
+    
     def __init__(
         self,
         source: SourceContainer[T],
         queue: BoundedBlockingQueue[T],
         name: str = "Producer",
-        delay: float = 0.0
+        delay: float = 0.0,
+        sentinel: Optional[T] = None,
+        batch_size: Optional[int] = None,
+        verbose: bool = True
     ):
         """
         Initialize the producer thread.
@@ -39,44 +50,98 @@ class Producer(threading.Thread, Generic[T]):
             queue: Shared blocking queue to place items into.
             name: Name of the producer thread.
             delay: Optional delay between producing items (in seconds).
+            sentinel: Optional value to put into the queue once the source
+                     is exhausted, telling a consumer to stop.
+            batch_size: Number of items to take from the source and publish
+                       to the queue with a single put_many() call. Defaults
+                       to DEFAULT_BATCH_SIZE when delay is 0, and to 1
+                       otherwise so delayed items are not held back.
+            verbose: Whether to print progress messages. Errors are
+                    always printed.
+        
+        Raises:
+            ValueError: If batch_size is not positive.
         """
+        if batch_size is None:
+            batch_size = self.DEFAULT_BATCH_SIZE if delay == 0 else 1
+        if batch_size <= 0:
+            raise ValueError("Batch size must be a positive integer")
+        
         super().__init__(name=name, daemon=False)
         self._source = source
         self._queue = queue
         self._delay = delay
+        self._sentinel = sentinel
+        self._batch_size = batch_size
+        self._verbose = verbose
+        # Only this thread writes the counter; readers either run after
+        # join() or accept a value that may be one batch behind.
         self._items_produced = 0
-        self._lock = threading.Lock()
     
     def run(self) -> None:
         """
         Main execution method for the producer thread.
         
         Reads items from the source container and places them
-        into the shared queue until the source is empty.
+        into the shared queue until the source is empty, then puts
+        the sentinel (if any) so the consumer knows to stop.
         """
-        print(f"[{self.name}] Started producing items")
+        if self._verbose:
+            print(f"[{self.name}] Started producing items")
         
-        while self._source.has_next():
-            item = self._source.get_next()
-            if item is not None:
-                try:
-                    # Put item into queue (will block if queue is full)
-                    self._queue.put(item)
-                    
-                    with self._lock:
-                        self._items_produced += 1
-                    
-                    print(f"[{self.name}] Produced item: {item}")
-                    
-                    # Optional delay to simulate processing time
-                    if self._delay > 0:
-                        time.sleep(self._delay)
-                
-                except Exception as e:
-                    print(f"[{self.name}] Error producing item: {e}")
+        # Hoist attribute and method lookups out of the loop
+        get_batch = self._source.get_batch
+        publish = self._publish
+        batch_size = self._batch_size
+        delay = self._delay
+        try:
+            while True:
+                # Take a whole batch from the source in one call; an empty
+                # batch means the source is exhausted
+                batch = get_batch(batch_size)
+                if not batch:
                     break
+                
+                # None entries in the source are skipped, as they are
+                # when items are produced one at a time
+                if any(item is None for item in batch):
+                    batch = [item for item in batch if item is not None]
+                    if not batch:
+                        continue
+                
+                publish(batch)
+                
+                # Optional delay to simulate processing time, per item
+                if delay > 0:
+                    time.sleep(delay * len(batch))
+        
+        except Exception as e:
+            print(f"[{self.name}] Error producing item: {e}")
+        
+        # Signal end of production
+        if self._sentinel is not None:
+            self._queue.put(self._sentinel)
+        
+        if self._verbose:
+            print(f"[{self.name}] Finished producing. Total items produced: {self.get_items_produced()}")
+    
+    def _publish(self, batch: List[T]) -> None:
+        """
+        Put a batch of items into the queue with one put_many() call.
+        
+        Will block while the queue is full. The queue copies the items,
+        so the caller may reuse the batch list afterwards.
+        
+        Args:
+            batch: Items to place into the queue, in order.
+        """
+        self._queue.put_many(batch)
+        
+        self._items_produced += len(batch)
         
-        print(f"[{self.name}] Finished producing. Total items produced: {self.get_items_produced()}")
+        if self._verbose:
+            for item in batch:
+                print(f"[{self.name}] Produced item: {item}")
     
     def get_items_produced(self) -> int:
         """
@@ -85,6 +150,5 @@ class Producer(threading.Thread, Generic[T]):
         Returns:
             Number of items produced.
         """
-        with self._lock:
-            return self._items_produced
+        return self._items_produced
 
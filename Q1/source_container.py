@@ -4,8 +4,9 @@ Source Container Implementation
 A container that holds items to be consumed by the producer.
 """
 
-import threading
-from typing import List, Generic, TypeVar, Optional
+import operator
+from itertools import islice
+from typing import List, Generic, Sequence, TypeVar, Optional
 
 T = TypeVar('T')
 
@@ -16,18 +17,26 @@ class SourceContainer(Generic[T]):
     
     This is a simple container that stores items and provides
     methods to read them sequentially.
+    
+    Reads go through a list iterator instead of an index guarded by a
+    lock: advancing a list iterator is a single C-level operation under
+    the GIL, so each item is still handed out exactly once even when
+    several producers share the container.
     """
     
-    def __init__(self, items: List[T]):
+    def __init__(self, items: Sequence[T], copy: bool = True):
         """
         Initialize the source container with items.
         
         Args:
-            items: List of items to store in the container.
+            items: Sequence of items to store in the container, e.g. a
+                  list or tuple.
+            copy: Whether to copy items so later changes by the caller do
+                 not affect the container. Pass False to take ownership of
+                 a sequence nothing else will modify and skip the copy.
         """
-        self._items = items.copy()
-        self._index = 0
-        self._lock = threading.Lock()
+        self._items = list(items) if copy else items
+        self._iter = iter(self._items)
     
     def has_next(self) -> bool:
         """
@@ -36,8 +45,7 @@ class SourceContainer(Generic[T]):
         Returns:
             True if there are more items, False otherwise.
         """
-        with self._lock:
-            return self._index < len(self._items)
+        return operator.length_hint(self._iter) > 0
     
     def get_next(self) -> Optional[T]:
         """
@@ -46,12 +54,20 @@ class SourceContainer(Generic[T]):
         Returns:
             The next item, or None if no more items are available.
         """
-        with self._lock:
-            if self._index < len(self._items):
-                item = self._items[self._index]
-                self._index += 1
-                return item
-            return None
+        return next(self._iter, None)
+    
+    def get_batch(self, max_items: int) -> List[T]:
+        """
+        Get up to max_items next items from the container in one call.
+        
+        Args:
+            max_items: Maximum number of items to return.
+        
+        Returns:
+            List of the next items, oldest first. Empty once no more
+            items are available.
+        """
+        return list(islice(self._iter, max_items))
     
     def get_all_items(self) -> List[T]:
         """
@@ -60,8 +76,7 @@ class SourceContainer(Generic[T]):
         Returns:
             List of all items in the container.
         """
-        with self._lock:
-            return self._items.copy()
+        return list(self._items)
     
     def size(self) -> int:
         """
@@ -70,8 +85,7 @@ class SourceContainer(Generic[T]):
         Returns:
             Total number of items.
         """
-        with self._lock:
-            return len(self._items)
+        return len(self._items)
     
     def remaining(self) -> int:
         """
@@ -80,6 +94,4 @@ class SourceContainer(Generic[T]):
         Returns:
             Number of remaining items.
         """
-        with self._lock:
-            return len(self._items) - self._index
-
+        return operator.length_hint(self._iter)
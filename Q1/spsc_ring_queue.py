@@ -0,0 +1,302 @@
+"""
+SPSC Ring Queue Implementation
+
+A bounded blocking queue specialised for exactly one producer thread and
+one consumer thread. Puts and gets that do not need to block take no lock.
+"""
+
+import threading
+import time
+from typing import Generic, List, TypeVar, Optional
+
+T = TypeVar('T')
+
+
+class SPSCRingQueue(Generic[T]):
+    """
+    A bounded single-producer/single-consumer queue backed by a ring buffer.
+    
+    The producer only ever writes ``_tail`` and the consumer only ever
+    writes ``_head``, so neither side needs a lock to publish its
+    progress: each reads the other's index with a plain load. Both
+    indices grow without wrapping and the current size is ``tail - head``.
+    The buffer is rounded up to a power of two so the slot is
+    ``index & mask`` rather than a modulo.
+    
+    A lock and two conditions are only used on the slow path, when the
+    producer finds the queue full or the consumer finds it empty. A
+    waiting side raises a flag under the lock before re-checking the
+    queue, and the other side only takes the lock to notify when that
+    flag is set.
+    
+    Correctness relies on the GIL making single bytecode loads and stores
+    sequentially consistent, and on there being at most one thread
+    calling put() and at most one thread calling get(). It provides the
+    put/get methods Producer and Consumer use, so it can be handed to a
+    single Producer and a single Consumer.
+    """
+    
+    __slots__ = (
+        '_capacity', '_mask', '_buffer', '_head', '_tail',
+        '_mutex', '_not_full', '_not_empty',
+        '_producer_waiting', '_consumer_waiting'
+    )
+    
+    def __init__(self, capacity: int):
+        """
+        Initialize the ring queue.
+        
+        Args:
+            capacity: Maximum number of items the queue can hold.
+                     Must be a positive integer.
+        
+        Raises:
+            ValueError: If capacity is not positive.
+        """
+        if capacity <= 0:
+            raise ValueError("Capacity must be a positive integer")
+        
+        self._capacity = capacity
+        # Smallest power of two >= capacity; only `capacity` slots are used
+        buffer_size = 1 << (capacity - 1).bit_length()
+        self._mask = buffer_size - 1
+        self._buffer: List[Optional[T]] = [None] * buffer_size
+        self._head = 0  # Next index to read, written only by the consumer
+        self._tail = 0  # Next index to write, written only by the producer
+        self._mutex = threading.Lock()
+        self._not_full = threading.Condition(self._mutex)
+        self._not_empty = threading.Condition(self._mutex)
+        self._producer_waiting = False
+        self._consumer_waiting = False
+    
+    def put(self, item: T, timeout: Optional[float] = None) -> bool:
+        """
+        Add an item to the queue. Must only be called from the producer thread.
+        
+        If the queue is full, this method will block until space becomes
+        available or timeout occurs.
+        
+        Args:
+            item: The item to add to the queue.
+            timeout: Maximum time to wait in seconds. None means wait indefinitely.
+        
+        Returns:
+            True once the item has been added.
+        
+        Raises:
+            RuntimeError: If timeout occurs.
+        """
+        tail = self._tail
+        if tail - self._head >= self._capacity:
+            self._wait_for_space(timeout)
+        
+        # Write the slot before publishing the new tail
+        self._buffer[tail & self._mask] = item
+        self._tail = tail + 1
+        
+        if self._consumer_waiting:
+            with self._mutex:
+                self._not_empty.notify()
+        return True
+    
+    def get(self, timeout: Optional[float] = None) -> T:
+        """
+        Remove and return an item. Must only be called from the consumer thread.
+        
+        If the queue is empty, this method will block until an item becomes
+        available or timeout occurs.
+        
+        Args:
+            timeout: Maximum time to wait in seconds. None means wait indefinitely.
+        
+        Returns:
+            The item removed from the queue.
+        
+        Raises:
+            RuntimeError: If timeout occurs.
+        """
+        head = self._head
+        if self._tail == head:
+            self._wait_for_item(timeout)
+        
+        # Read and clear the slot before publishing the new head
+        slot = head & self._mask
+        item = self._buffer[slot]
+        self._buffer[slot] = None
+        self._head = head + 1
+        
+        if self._producer_waiting:
+            with self._mutex:
+                self._not_full.notify()
+        return item
+    
+    def put_many(self, items: List[T], timeout: Optional[float] = None) -> int:
+        """
+        Add several items to the queue, in order.
+        
+        Args:
+            items: The items to add to the queue.
+            timeout: Maximum time to wait in seconds for each item.
+                     None means wait indefinitely.
+        
+        Returns:
+            Number of items added.
+        
+        Raises:
+            RuntimeError: If timeout occurs. Items added before the
+                         timeout remain in the queue.
+        """
+        for item in items:
+            self.put(item, timeout)
+        return len(items)
+    
+    def get_many(
+        self,
+        max_items: int,
+        timeout: Optional[float] = None,
+        stop_event: Optional[threading.Event] = None,
+        stop_at: Optional[T] = None
+    ) -> List[T]:
+        """
+        Remove and return up to max_items items.
+        
+        Blocks until at least one item is available or stop_event is set,
+        then takes whatever else is already in the queue without waiting
+        for more.
+        
+        Args:
+            max_items: Maximum number of items to remove. Must be positive.
+            timeout: Maximum time to wait in seconds. None means wait indefinitely.
+            stop_event: Optional event that ends the wait early. Whoever
+                       sets it should call wakeup_all() to wake the consumer.
+            stop_at: Optional item (matched by identity) that ends the
+                    batch: it is the last item removed, and anything after
+                    it stays in the queue.
+        
+        Returns:
+            List of removed items, oldest first. Empty if stop_event was
+            set while the queue was empty.
+        
+        Raises:
+            ValueError: If max_items is not positive.
+            RuntimeError: If timeout occurs.
+        """
+        if max_items <= 0:
+            raise ValueError("max_items must be a positive integer")
+        
+        if self._tail == self._head and not self._wait_for_item(timeout, stop_event):
+            return []
+        
+        item = self.get()
+        items = [item]
+        while len(items) < max_items and self._tail != self._head:
+            if stop_at is not None and item is stop_at:
+                break
+            item = self.get()
+            items.append(item)
+        return items
+    
+    def _wait_for_space(self, timeout: Optional[float]) -> None:
+        """
+        Block the producer until the queue is not full.
+        
+        Args:
+            timeout: Maximum time to wait in seconds. None means wait indefinitely.
+        
+        Raises:
+            RuntimeError: If timeout occurs.
+        """
+        with self._not_full:
+            self._producer_waiting = True
+            try:
+                deadline = None if timeout is None else time.monotonic() + timeout
+                while self._tail - self._head >= self._capacity:
+                    if deadline is None:
+                        self._not_full.wait()
+                    else:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise RuntimeError("Timeout waiting to put item in queue")
+                        self._not_full.wait(remaining)
+            finally:
+                self._producer_waiting = False
+    
+    def _wait_for_item(
+        self,
+        timeout: Optional[float],
+        stop_event: Optional[threading.Event] = None
+    ) -> bool:
+        """
+        Block the consumer until the queue is not empty.
+        
+        Args:
+            timeout: Maximum time to wait in seconds. None means wait indefinitely.
+            stop_event: Optional event that ends the wait early.
+        
+        Returns:
+            True once an item is available, False if stop_event was set first.
+        
+        Raises:
+            RuntimeError: If timeout occurs.
+        """
+        with self._not_empty:
+            self._consumer_waiting = True
+            try:
+                deadline = None if timeout is None else time.monotonic() + timeout
+                while self._tail == self._head:
+                    if stop_event is not None and stop_event.is_set():
+                        return False
+                    if deadline is None:
+                        self._not_empty.wait()
+                    else:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise RuntimeError("Timeout waiting to get item from queue")
+                        self._not_empty.wait(remaining)
+            finally:
+                self._consumer_waiting = False
+        return True
+    
+    def wakeup_all(self) -> None:
+        """
+        Wake the consumer if it is blocked waiting for an item, so it can
+        recheck its stop_event.
+        """
+        with self._not_empty:
+            self._not_empty.notify_all()
+    
+    def size(self) -> int:
+        """
+        Get the current number of items in the queue.
+        
+        Returns:
+            Current queue size.
+        """
+        return self._tail - self._head
+    
+    def capacity(self) -> int:
+        """
+        Get the maximum capacity of the queue.
+        
+        Returns:
+            Queue capacity.
+        """
+        return self._capacity
+    
+    def is_empty(self) -> bool:
+        """
+        Check if the queue is empty.
+        
+        Returns:
+            True if queue is empty, False otherwise.
+        """
+        return self._tail == self._head
+    
+    def is_full(self) -> bool:
+        """
+        Check if the queue is full.
+        
+        Returns:
+            True if queue is full, False otherwise.
+        """
+        return self._tail - self._head >= self._capacity
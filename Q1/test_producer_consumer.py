@@ -9,18 +9,29 @@ Tests cover:
 - Producer and Consumer functionality
 """
 
+import io
 import unittest
 import threading
 import time
+from collections import Counter
+from contextlib import redirect_stdout
 from typing import List
+from unittest.mock import call, patch
 
 from bounded_blocking_queue import BoundedBlockingQueue
+from spsc_ring_queue import SPSCRingQueue
 from source_container import SourceContainer
 from destination_container import DestinationContainer
 from producer import Producer
 from consumer import Consumer
 
 
+# Shared, immutable item ranges reused across tests
+RANGE_10 = tuple(range(10))
+RANGE_15 = tuple(range(15))
+RANGE_20 = tuple(range(20))
+
+
 class TestBoundedBlockingQueue(unittest.TestCase):
     """Test cases for BoundedBlockingQueue."""
     
@@ -106,21 +117,26 @@ class TestBoundedBlockingQueue(unittest.TestCase):
         queue = BoundedBlockingQueue[int](10)
         results = []
         errors = []
+        # Release both threads together so neither runs alone at first
+        barrier = threading.Barrier(2)
         
         def producer():
+            put, sleep = queue.put, time.sleep
+            barrier.wait()
             try:
                 for i in range(10):
-                    queue.put(i)
-                    time.sleep(0.01)
+                    put(i)
+                    sleep(0.01)
             except Exception as e:
                 errors.append(e)
         
         def consumer():
+            get, append, sleep = queue.get, results.append, time.sleep
+            barrier.wait()
             try:
                 for _ in range(10):
-                    item = queue.get()
-                    results.append(item)
-                    time.sleep(0.01)
+                    append(get())
+                    sleep(0.01)
             except Exception as e:
                 errors.append(e)
         
@@ -135,23 +151,24 @@ class TestBoundedBlockingQueue(unittest.TestCase):
         
         self.assertEqual(len(errors), 0)
         self.assertEqual(len(results), 10)
-        self.assertEqual(sorted(results), list(range(10)))
+        self.assertEqual(sorted(results), list(RANGE_10))
     
     def test_multiple_producers_and_consumers(self):
         """Test multiple producers and consumers."""
         queue = BoundedBlockingQueue[int](20)
-        results = []
-        lock = threading.Lock()
+        # One result list per consumer, merged after join, so consumers
+        # do not contend on a shared lock
+        per_thread_results = [[], []]
         
         def producer(start, count):
+            put = queue.put
             for i in range(start, start + count):
-                queue.put(i)
+                put(i)
         
-        def consumer(count):
+        def consumer(index, count):
+            get, append = queue.get, per_thread_results[index].append
             for _ in range(count):
-                item = queue.get()
-                with lock:
-                    results.append(item)
+                append(get())
         
         # Create 3 producers, each producing 5 items
         prod_threads = [
@@ -161,8 +178,8 @@ class TestBoundedBlockingQueue(unittest.TestCase):
         
         # Create 2 consumers, each consuming 7-8 items
         cons_threads = [
-            threading.Thread(target=consumer, args=(8,)),
-            threading.Thread(target=consumer, args=(7,))
+            threading.Thread(target=consumer, args=(0, 8)),
+            threading.Thread(target=consumer, args=(1, 7))
         ]
         
         for t in prod_threads:
@@ -175,8 +192,223 @@ class TestBoundedBlockingQueue(unittest.TestCase):
         for t in cons_threads:
             t.join()
         
+        results = per_thread_results[0] + per_thread_results[1]
         self.assertEqual(len(results), 15)
-        self.assertEqual(sorted(results), list(range(15)))
+        self.assertEqual(sorted(results), list(RANGE_15))
+    
+    def test_back_to_back_puts_wake_all_waiting_consumers(self):
+        """Test that waiting consumers are not stranded by consecutive puts."""
+        queue = BoundedBlockingQueue[int](5)
+        results = []
+        
+        def consumer():
+            results.append(queue.get(timeout=2.0))
+        
+        cons_threads = [threading.Thread(target=consumer) for _ in range(2)]
+        for t in cons_threads:
+            t.start()
+        
+        # Give both consumers time to block on the empty queue
+        time.sleep(0.1)
+        queue.put(1)
+        queue.put(2)
+        
+        for t in cons_threads:
+            t.join()
+        
+        self.assertEqual(sorted(results), [1, 2])
+    
+    def test_get_many_wakes_one_producer_per_freed_slot(self):
+        """Test that freeing several slots at once unblocks several producers."""
+        queue = BoundedBlockingQueue[int](2)
+        queue.put_many([1, 2])
+        errors = []
+        
+        def producer(item):
+            try:
+                queue.put(item, timeout=2.0)
+            except RuntimeError as e:
+                errors.append(e)
+        
+        prod_threads = [threading.Thread(target=producer, args=(i,)) for i in (3, 4)]
+        for t in prod_threads:
+            t.start()
+        
+        # Give both producers time to block on the full queue
+        time.sleep(0.1)
+        self.assertEqual(queue.get_many(2), [1, 2])
+        
+        for t in prod_threads:
+            t.join()
+        
+        self.assertEqual(errors, [])
+        self.assertEqual(sorted(queue.get_many(2)), [3, 4])
+    
+    def test_join_waits_until_drained(self):
+        """Test join() returns once consumers have emptied the queue."""
+        queue = BoundedBlockingQueue[int](5)
+        queue.put_many([1, 2, 3])
+        
+        with self.assertRaises(RuntimeError):
+            queue.join(timeout=0.05)
+        
+        def consumer():
+            for _ in range(3):
+                queue.get()
+        
+        thread = threading.Thread(target=consumer)
+        thread.start()
+        queue.join(timeout=2.0)
+        self.assertTrue(queue.is_empty())
+        thread.join()
+    
+    def test_put_many_and_get_many(self):
+        """Test transferring items in batches."""
+        queue = BoundedBlockingQueue[int](10)
+        self.assertEqual(queue.put_many([1, 2, 3, 4, 5]), 5)
+        self.assertEqual(queue.size(), 5)
+        
+        self.assertEqual(queue.get_many(3), [1, 2, 3])
+        self.assertEqual(queue.get_many(10), [4, 5])
+        self.assertTrue(queue.is_empty())
+    
+    def test_get_many_stops_at_item(self):
+        """Test get_many ends a batch at stop_at and leaves the rest queued."""
+        stop = object()
+        queue = BoundedBlockingQueue[object](10)
+        queue.put_many([1, stop, 2])
+        
+        self.assertEqual(queue.get_many(10, stop_at=stop), [1, stop])
+        self.assertEqual(queue.get_many(10, stop_at=stop), [2])
+    
+    def test_put_many_larger_than_capacity(self):
+        """Test put_many blocks until a consumer makes room."""
+        queue = BoundedBlockingQueue[int](3)
+        results = []
+        
+        def consumer():
+            while len(results) < 8:
+                results.extend(queue.get_many(2))
+        
+        cons_thread = threading.Thread(target=consumer)
+        cons_thread.start()
+        queue.put_many(list(range(8)))
+        cons_thread.join()
+        
+        self.assertEqual(results, list(range(8)))
+    
+    def test_put_many_timeout(self):
+        """Test put_many times out on a full queue."""
+        queue = BoundedBlockingQueue[int](2)
+        
+        with self.assertRaises(RuntimeError):
+            queue.put_many([1, 2, 3], timeout=0.1)
+        # Items that fit before the timeout stay in the queue
+        self.assertEqual(queue.size(), 2)
+    
+    def test_get_many_timeout(self):
+        """Test get_many times out on an empty queue."""
+        queue = BoundedBlockingQueue[int](5)
+        
+        with self.assertRaises(RuntimeError):
+            queue.get_many(3, timeout=0.1)
+    
+    def test_get_many_invalid_max_items(self):
+        """Test get_many rejects a non-positive batch size."""
+        queue = BoundedBlockingQueue[int](5)
+        
+        with self.assertRaises(ValueError):
+            queue.get_many(0)
+
+
+class TestSPSCRingQueue(unittest.TestCase):
+    """Test cases for SPSCRingQueue."""
+    
+    def test_queue_initialization(self):
+        """Test queue initialization and invalid capacity."""
+        queue = SPSCRingQueue[int](3)
+        self.assertEqual(queue.capacity(), 3)
+        self.assertTrue(queue.is_empty())
+        self.assertFalse(queue.is_full())
+        
+        with self.assertRaises(ValueError):
+            SPSCRingQueue[int](0)
+    
+    def test_wraparound_preserves_order(self):
+        """Test FIFO order as the indices wrap around the ring several times."""
+        queue = SPSCRingQueue[int](3)
+        
+        for start in range(0, 12, 3):
+            for i in range(start, start + 3):
+                queue.put(i)
+            self.assertTrue(queue.is_full())
+            self.assertEqual([queue.get() for _ in range(3)], [start, start + 1, start + 2])
+            self.assertTrue(queue.is_empty())
+    
+    def test_put_and_get_timeout(self):
+        """Test put times out on a full queue and get on an empty one."""
+        queue = SPSCRingQueue[int](1)
+        
+        with self.assertRaises(RuntimeError):
+            queue.get(timeout=0.1)
+        
+        queue.put(1)
+        with self.assertRaises(RuntimeError):
+            queue.put(2, timeout=0.1)
+        self.assertEqual(queue.size(), 1)
+    
+    def test_get_many(self):
+        """Test get_many takes only what is already queued."""
+        queue = SPSCRingQueue[int](5)
+        queue.put_many([1, 2, 3])
+        
+        self.assertEqual(queue.get_many(2), [1, 2])
+        self.assertEqual(queue.get_many(5), [3])
+        with self.assertRaises(ValueError):
+            queue.get_many(0)
+    
+    def test_get_many_stops_at_item(self):
+        """Test get_many ends a batch at stop_at and leaves the rest queued."""
+        stop = object()
+        queue = SPSCRingQueue[object](5)
+        queue.put_many([1, stop, 2])
+        
+        self.assertEqual(queue.get_many(5, stop_at=stop), [1, stop])
+        self.assertEqual(queue.get_many(5, stop_at=stop), [2])
+    
+    def test_concurrent_transfer(self):
+        """Test one producer and one consumer thread through a small ring."""
+        queue = SPSCRingQueue[int](4)
+        received: List[int] = []
+        
+        def consumer():
+            for _ in range(5000):
+                received.append(queue.get(timeout=5))
+        
+        thread = threading.Thread(target=consumer)
+        thread.start()
+        for i in range(5000):
+            queue.put(i, timeout=5)
+        thread.join()
+        
+        self.assertEqual(received, list(range(5000)))
+        self.assertTrue(queue.is_empty())
+    
+    def test_with_producer_and_consumer(self):
+        """Test the ring queue as a drop-in for one Producer and one Consumer."""
+        source = SourceContainer[int](RANGE_20)
+        queue = SPSCRingQueue[int](3)
+        destination = DestinationContainer[int]()
+        
+        producer = Producer(source, queue, name="P1", sentinel=-1, verbose=False)
+        consumer = Consumer(queue, destination, name="C1", sentinel=-1, verbose=False)
+        
+        consumer.start()
+        producer.start()
+        producer.join()
+        consumer.join()
+        
+        self.assertEqual(destination.get_all_items(), list(RANGE_20))
 
 
 class TestSourceContainer(unittest.TestCase):
@@ -217,6 +449,47 @@ class TestSourceContainer(unittest.TestCase):
         self.assertEqual(all_items, items)
         # Original items should not be modified
         self.assertEqual(container.size(), 5)
+    
+    def test_get_batch(self):
+        """Test reading items in batches."""
+        container = SourceContainer[int](list(range(5)))
+        
+        self.assertEqual(container.get_batch(2), [0, 1])
+        self.assertEqual(container.get_batch(4), [2, 3, 4])
+        self.assertEqual(container.get_batch(4), [])
+        self.assertFalse(container.has_next())
+    
+    def test_copy_flag(self):
+        """Test that the container copies its items unless told not to."""
+        items = [1, 2, 3]
+        copied = SourceContainer[int](items)
+        shared = SourceContainer[int](items, copy=False)
+        
+        items.append(4)
+        self.assertEqual(copied.size(), 3)
+        self.assertEqual(shared.size(), 4)
+    
+    def test_shared_container_hands_out_each_item_once(self):
+        """Test that concurrent readers never receive the same item twice."""
+        container = SourceContainer[int](list(range(1000)))
+        results = [[] for _ in range(4)]
+        
+        def reader(index):
+            while True:
+                item = container.get_next()
+                if item is None:
+                    break
+                results[index].append(item)
+        
+        threads = [threading.Thread(target=reader, args=(i,)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        all_items = [item for result in results for item in result]
+        self.assertEqual(sorted(all_items), list(range(1000)))
+        self.assertEqual(container.remaining(), 0)
 
 
 class TestDestinationContainer(unittest.TestCase):
@@ -251,6 +524,42 @@ class TestDestinationContainer(unittest.TestCase):
         all_items = container.get_all_items()
         self.assertEqual(all_items, items)
     
+    def test_get_all_items_returns_independent_lists(self):
+        """Test each call returns a fresh list that tracks container changes."""
+        container = DestinationContainer[int]()
+        container.add(1)
+        
+        snapshot = container.get_all_items()
+        snapshot.append(99)
+        self.assertEqual(container.get_all_items(), [1])
+        
+        container.add(2)
+        self.assertEqual(container.get_all_items(), [1, 2])
+        self.assertEqual(snapshot, [1, 99])
+        
+        container.clear()
+        self.assertEqual(container.get_all_items(), [])
+    
+    def test_concurrent_adds_and_reads(self):
+        """Test concurrent adds from several threads while another reads."""
+        container = DestinationContainer[int]()
+        
+        def writer(start: int):
+            for i in range(start, start + 500):
+                container.add(i)
+        
+        threads = [threading.Thread(target=writer, args=(n * 500,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        while any(thread.is_alive() for thread in threads):
+            snapshot = container.get_all_items()
+            self.assertEqual(len(set(snapshot)), len(snapshot))
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(container.size(), 2000)
+        self.assertEqual(sorted(container.get_all_items()), list(range(2000)))
+    
     def test_clear(self):
         """Test clearing the container."""
         container = DestinationContainer[int]()
@@ -283,14 +592,66 @@ class TestProducer(unittest.TestCase):
         queue = BoundedBlockingQueue[int](10)
         
         producer = Producer(source, queue, delay=0.05)
-        start_time = time.time()
+        # Record the delays instead of actually sleeping
+        with patch('producer.time.sleep') as sleep:
+            producer.start()
+            producer.join()
+        
+        self.assertEqual(producer.get_items_produced(), 5)
+        # One 0.05s delay per item
+        self.assertEqual(sleep.call_args_list, [call(0.05)] * 5)
+    
+    def test_producer_batches(self):
+        """Test producer publishing items in batches."""
+        source = SourceContainer[int](list(range(7)))
+        queue = BoundedBlockingQueue[int](10)
+        
+        producer = Producer(source, queue, batch_size=3)
         producer.start()
         producer.join()
-        elapsed = time.time() - start_time
         
-        self.assertEqual(producer.get_items_produced(), 5)
-        # Should take at least 5 * 0.05 = 0.25 seconds
-        self.assertGreaterEqual(elapsed, 0.2)
+        self.assertEqual(producer.get_items_produced(), 7)
+        self.assertEqual(queue.get_many(10), list(range(7)))
+    
+    def test_producer_skips_none_items(self):
+        """Test producer does not publish None entries from the source."""
+        source = SourceContainer[str](["a", None, "b", None, None, None])
+        queue = BoundedBlockingQueue[str](10)
+        
+        producer = Producer(source, queue, batch_size=2, verbose=False)
+        producer.start()
+        producer.join()
+        
+        self.assertEqual(producer.get_items_produced(), 2)
+        self.assertEqual(queue.get_many(10), ["a", "b"])
+    
+    def test_producer_invalid_batch_size(self):
+        """Test producer rejects a non-positive batch size."""
+        source = SourceContainer[int]([1])
+        queue = BoundedBlockingQueue[int](10)
+        
+        with self.assertRaises(ValueError):
+            Producer(source, queue, batch_size=0)
+    
+    def test_producer_and_consumer_quiet(self):
+        """Test that verbose=False suppresses progress output."""
+        source = SourceContainer[int](list(range(5)))
+        queue = BoundedBlockingQueue[int](10)
+        destination = DestinationContainer[int]()
+        
+        output = io.StringIO()
+        with redirect_stdout(output):
+            producer = Producer(source, queue, verbose=False)
+            producer.start()
+            producer.join()
+            queue.put(-1)
+            
+            consumer = Consumer(queue, destination, sentinel=-1, verbose=False)
+            consumer.start()
+            consumer.join()
+        
+        self.assertEqual(destination.size(), 5)
+        self.assertEqual(output.getvalue(), "")
 
 
 class TestConsumer(unittest.TestCase):
@@ -305,13 +666,12 @@ class TestConsumer(unittest.TestCase):
         for i in range(5):
             queue.put(i)
         
-        consumer = Consumer(queue, destination, sentinel=-1)
+        consumer = Consumer(queue, destination)
         consumer.start()
         
-        # Wait a bit for consumer to process
-        time.sleep(0.2)
+        # Wait for the consumer to drain the queue, then stop it
+        queue.join()
         consumer.request_stop()
-        queue.put(-1)  # Send sentinel
         consumer.join()
         
         self.assertEqual(consumer.get_items_consumed(), 5)
@@ -326,125 +686,155 @@ class TestConsumer(unittest.TestCase):
         for i in range(3):
             queue.put(i)
         
-        consumer = Consumer(queue, destination, delay=0.05, sentinel=-1)
-        start_time = time.time()
+        consumer = Consumer(queue, destination, delay=0.05)
+        # Record the delays instead of actually sleeping
+        with patch('consumer.time.sleep') as sleep:
+            consumer.start()
+            queue.join()
+            consumer.request_stop()
+            consumer.join()
+        
+        self.assertEqual(consumer.get_items_consumed(), 3)
+        # One 0.05s delay per item
+        self.assertEqual(sleep.call_args_list, [call(0.05)] * 3)
+    
+    def test_request_stop_wakes_blocked_consumer(self):
+        """Test request_stop() unblocks a consumer waiting on an empty queue."""
+        for queue in (BoundedBlockingQueue[int](5), SPSCRingQueue[int](5)):
+            destination = DestinationContainer[int]()
+            consumer = Consumer(queue, destination, verbose=False)
+            consumer.start()
+            
+            # Give the consumer time to block on the empty queue
+            time.sleep(0.05)
+            consumer.request_stop()
+            consumer.join(timeout=2.0)
+            
+            self.assertFalse(consumer.is_alive())
+            self.assertEqual(consumer.get_items_consumed(), 0)
+    
+    def test_consumer_batch_leaves_items_after_sentinel(self):
+        """Test batched consumer leaves items after the sentinel in the queue."""
+        queue = BoundedBlockingQueue[int](10)
+        destination = DestinationContainer[int]()
+        
+        queue.put_many([1, 2, -1, -1, 3])
+        
+        consumer = Consumer(queue, destination, sentinel=-1, batch_size=10)
         consumer.start()
+        consumer.join()
         
-        time.sleep(0.3)
-        consumer.request_stop()
-        queue.put(-1)
+        self.assertEqual(destination.get_all_items(), [1, 2])
+        # The second consumer's sentinel is still available, in order
+        self.assertEqual(queue.get_many(10), [-1, 3])
+    
+    def test_consumer_matches_sentinel_by_identity(self):
+        """Test an item equal to, but not the same as, the sentinel is consumed."""
+        sentinel = ["STOP"]
+        queue = BoundedBlockingQueue[list](10)
+        destination = DestinationContainer[list]()
+        
+        queue.put_many([["STOP"], sentinel])
+        
+        consumer = Consumer(queue, destination, sentinel=sentinel, verbose=False)
+        consumer.start()
         consumer.join()
-        elapsed = time.time() - start_time
         
-        self.assertEqual(consumer.get_items_consumed(), 3)
-        # Should take at least 3 * 0.05 = 0.15 seconds
-        self.assertGreaterEqual(elapsed, 0.1)
+        self.assertEqual(destination.get_all_items(), [["STOP"]])
 
 
 class TestProducerConsumerIntegration(unittest.TestCase):
     """Integration tests for Producer-Consumer pattern."""
     
-    def test_single_producer_single_consumer(self):
-        """Test single producer and single consumer."""
-        source_items = list(range(10))
-        source = SourceContainer[int](source_items)
-        queue = BoundedBlockingQueue[int](5)
+    def test_producer_sentinel_stops_consumer(self):
+        """Test that a producer's sentinel shuts the consumer down on its own."""
+        source = SourceContainer[int](RANGE_10)
+        queue = BoundedBlockingQueue[int](3)
         destination = DestinationContainer[int]()
         
-        producer = Producer(source, queue, name="P1")
+        producer = Producer(source, queue, name="P1", sentinel=-1)
         consumer = Consumer(queue, destination, name="C1", sentinel=-1)
         
         consumer.start()
         producer.start()
-        
         producer.join()
-        
-        # Wait a bit, then stop consumer
-        time.sleep(0.2)
-        consumer.request_stop()
-        try:
-            queue.put(-1, timeout=0.1)
-        except:
-            pass
         consumer.join()
         
-        self.assertEqual(producer.get_items_produced(), 10)
-        self.assertEqual(consumer.get_items_consumed(), 10)
-        self.assertEqual(destination.size(), 10)
-        self.assertEqual(set(destination.get_all_items()), set(source_items))
+        self.assertEqual(destination.get_all_items(), list(RANGE_10))
+        self.assertTrue(queue.is_empty())
     
-    def test_multiple_producers_single_consumer(self):
-        """Test multiple producers and single consumer."""
-        queue = BoundedBlockingQueue[int](10)
-        destination = DestinationContainer[int]()
-        
-        source1 = SourceContainer[int](list(range(0, 5)))
-        source2 = SourceContainer[int](list(range(5, 10)))
-        
-        producer1 = Producer(source1, queue, name="P1")
-        producer2 = Producer(source2, queue, name="P2")
-        consumer = Consumer(queue, destination, name="C1", sentinel=-1)
-        
-        consumer.start()
-        producer1.start()
-        producer2.start()
+    def _run_pc(self, n_producers: int, n_consumers: int, n_items: int, capacity: int):
+        """
+        Run producers and consumers over one queue until every item is consumed.
+        
+        Items 0..n_items-1 are split evenly across one source per producer,
+        and each consumer stores into its own destination.
+        
+        Returns:
+            Tuple of (producers, consumers, destinations).
+        """
+        queue = BoundedBlockingQueue[int](capacity)
+        per_producer = n_items // n_producers
+        producers = [
+            Producer(
+                SourceContainer[int](range(i * per_producer, (i + 1) * per_producer)),
+                queue,
+                name=f"P{i + 1}"
+            )
+            for i in range(n_producers)
+        ]
+        destinations = [DestinationContainer[int]() for _ in range(n_consumers)]
+        consumers = [
+            Consumer(queue, destination, name=f"C{i + 1}")
+            for i, destination in enumerate(destinations)
+        ]
         
-        producer1.join()
-        producer2.join()
+        for consumer in consumers:
+            consumer.start()
+        for producer in producers:
+            producer.start()
+        for producer in producers:
+            producer.join()
+        
+        # Wait for the queue to drain, then stop the consumers
+        queue.join()
+        for consumer in consumers:
+            consumer.request_stop()
+        for consumer in consumers:
+            consumer.join()
+        
+        return producers, consumers, destinations
+    
+    def test_single_producer_single_consumer(self):
+        """Test single producer and single consumer."""
+        producers, consumers, destinations = self._run_pc(1, 1, 10, 5)
         
-        time.sleep(0.3)
-        consumer.request_stop()
-        try:
-            queue.put(-1, timeout=0.1)
-        except:
-            pass
-        consumer.join()
+        self.assertEqual(producers[0].get_items_produced(), 10)
+        self.assertEqual(consumers[0].get_items_consumed(), 10)
+        self.assertEqual(destinations[0].size(), 10)
+        self.assertEqual(Counter(destinations[0].get_all_items()), Counter(RANGE_10))
+    
+    def test_multiple_producers_single_consumer(self):
+        """Test multiple producers and single consumer."""
+        producers, consumers, destinations = self._run_pc(2, 1, 10, 10)
         
-        total_produced = producer1.get_items_produced() + producer2.get_items_produced()
+        total_produced = sum(p.get_items_produced() for p in producers)
         self.assertEqual(total_produced, 10)
-        self.assertEqual(consumer.get_items_consumed(), 10)
-        self.assertEqual(destination.size(), 10)
+        self.assertEqual(consumers[0].get_items_consumed(), 10)
+        self.assertEqual(destinations[0].size(), 10)
     
     def test_single_producer_multiple_consumers(self):
         """Test single producer and multiple consumers."""
-        source = SourceContainer[int](list(range(20)))
-        queue = BoundedBlockingQueue[int](10)
-        destination1 = DestinationContainer[int]()
-        destination2 = DestinationContainer[int]()
-        
-        producer = Producer(source, queue, name="P1")
-        consumer1 = Consumer(queue, destination1, name="C1", sentinel=-1)
-        consumer2 = Consumer(queue, destination2, name="C2", sentinel=-1)
-        
-        consumer1.start()
-        consumer2.start()
-        producer.start()
+        producers, consumers, destinations = self._run_pc(1, 2, 20, 10)
         
-        producer.join()
-        
-        time.sleep(0.5)
-        consumer1.request_stop()
-        consumer2.request_stop()
-        
-        try:
-            queue.put(-1, timeout=0.1)
-            queue.put(-1, timeout=0.1)
-        except:
-            pass
-        
-        consumer1.join()
-        consumer2.join()
-        
-        total_consumed = (
-            consumer1.get_items_consumed() + consumer2.get_items_consumed()
-        )
-        self.assertEqual(producer.get_items_produced(), 20)
+        total_consumed = sum(c.get_items_consumed() for c in consumers)
+        self.assertEqual(producers[0].get_items_produced(), 20)
         self.assertEqual(total_consumed, 20)
         
         # All items should be in one of the destinations
-        all_items = destination1.get_all_items() + destination2.get_all_items()
+        all_items = destinations[0].get_all_items() + destinations[1].get_all_items()
         self.assertEqual(len(all_items), 20)
-        self.assertEqual(set(all_items), set(range(20)))
+        self.assertEqual(Counter(all_items), Counter(RANGE_20))
     
     def test_thread_synchronization(self):
         """Test that thread synchronization works correctly."""
@@ -453,19 +843,15 @@ class TestProducerConsumerIntegration(unittest.TestCase):
         destination = DestinationContainer[str]()
         
         producer = Producer(source, queue, name="P1", delay=0.01)
-        consumer = Consumer(queue, destination, name="C1", delay=0.02, sentinel="STOP")
+        consumer = Consumer(queue, destination, name="C1", delay=0.02)
         
         consumer.start()
         producer.start()
         
         producer.join()
         
-        time.sleep(0.5)
+        queue.join()
         consumer.request_stop()
-        try:
-            queue.put("STOP", timeout=0.1)
-        except:
-            pass
         consumer.join()
         
         # Verify all items were transferred
@@ -473,8 +859,8 @@ class TestProducerConsumerIntegration(unittest.TestCase):
         self.assertEqual(consumer.get_items_consumed(), 50)
         self.assertEqual(destination.size(), 50)
         self.assertEqual(
-            set(source.get_all_items()),
-            set(destination.get_all_items())
+            Counter(source.get_all_items()),
+            Counter(destination.get_all_items())
         )
 
 
@@ -3,18 +3,209 @@ Data Analysis Module
 Implements various analysis functions using functional programming patterns.
 """
 
-from typing import List, Dict, Tuple
-from functools import reduce
+from typing import Callable, List, Dict, NamedTuple, Tuple, TypeVar
+import heapq
+import math
 from collections import defaultdict
+from functools import lru_cache, wraps
+from operator import attrgetter, itemgetter
 
 from models import SalesRecord
 
+R = TypeVar('R')
+
+
+_revenue = attrgetter('total_revenue')
+_units = attrgetter('units_sold')
+_price = attrgetter('unit_price')
+_amount = itemgetter(1)
+
+
+def _memoize_last(
+    func: Callable[[List[SalesRecord]], R]
+) -> Callable[[List[SalesRecord]], R]:
+    """
+    Remember the result of a records-only helper for the most recent records.
+    
+    The report functions are called one after another with the same list,
+    so the grouping behind them only needs computing once. The cache keeps
+    a shallow copy of the records its result came from, and reuses the
+    result only while the argument compares equal to that copy. The key
+    is the list's contents, not its identity: every call pays an O(N)
+    equality check. Identical items compare equal without calling __eq__,
+    so for an unchanged list that check is a C-level walk over pointers,
+    far cheaper than regrouping. Appending, removing or replacing a
+    record in place causes a recompute, and so does an equal-length list
+    whose records differ.
+    
+    Like functools.lru_cache, the wrapper has a cache_clear() method that
+    drops the cached records and result.
+    
+    Args:
+        func: Helper taking the records list as its only argument. Its
+              result is shared between callers and must not be modified.
+        
+    Returns:
+        The wrapped helper
+    """
+    cache = None
+    
+    @wraps(func)
+    def wrapper(records: List[SalesRecord]) -> R:
+        nonlocal cache
+        if cache is not None and cache[0] == records:
+            return cache[1]
+        result = func(records)
+        # Slicing copies a list, but returns a tuple itself: tuples cannot
+        # change, so the tuple is its own snapshot
+        cache = (records[:], result)
+        return result
+    
+    def cache_clear() -> None:
+        nonlocal cache
+        cache = None
+    
+    wrapper.cache_clear = cache_clear
+    return wrapper
+
+
+def clear_cache() -> None:
+    """
+    Drop the records and totals cached from the most recent analysis.
+    
+    The analysis functions keep the records they were last called with, so
+    repeated calls share one aggregation pass. Call this once a dataset is
+    no longer needed so it can be freed.
+    """
+    _aggregate.cache_clear()
+
+
+# Dates repeat across records (many sales per day), so each distinct date
+# string is split once and its month and year keys are reused afterwards.
+@lru_cache(maxsize=4096)
+def _date_keys(date: str) -> Tuple[str, str]:
+    """Extract the YYYY-MM month and YYYY year keys from a date string."""
+    date_parts = date.split('-')
+    if len(date_parts) >= 2:
+        month = f"{date_parts[0]}-{date_parts[1]}"
+    else:
+        month = date[:7] if len(date) >= 7 else "Unknown"
+    # split() always returns at least one part
+    return month, date_parts[0]
+
+
+class _Aggregates(NamedTuple):
+    """Revenue and units totals computed in one pass over the records."""
+    revenue_by_product: Dict[str, float]
+    revenue_by_region: Dict[str, float]
+    revenue_by_month: Dict[str, float]
+    revenue_by_year: Dict[str, float]
+    units_by_product: Dict[str, float]
+    units_by_region: Dict[str, float]
+    units_by_month: Dict[str, float]
+    units_by_year: Dict[str, float]
+    units_by_year_and_product: Dict[str, Dict[str, float]]
+    price_by_product: Dict[str, float]
+    count_by_product: Dict[str, int]
+    count_by_region: Dict[str, int]
+    most_expensive: Tuple[str, float]
+    least_expensive: Tuple[str, float]
+    revenue: float
+    units: float
+
+
+@_memoize_last
+def _aggregate(records: List[SalesRecord]) -> _Aggregates:
+    """
+    Compute every per-group and overall revenue and units total at once.
+    
+    Walks the records a single time instead of once per grouping, and is
+    memoized so the report functions that all call this with the same
+    records share one pass.
+    
+    Args:
+        records: List of sales records
+        
+    Returns:
+        Aggregates for the records. Its dictionaries are shared with the
+        cache and must not be modified.
+    """
+    revenue_by_product = defaultdict(float)
+    revenue_by_region = defaultdict(float)
+    revenue_by_month = defaultdict(float)
+    revenue_by_year = defaultdict(float)
+    units_by_product = defaultdict(float)
+    units_by_region = defaultdict(float)
+    units_by_month = defaultdict(float)
+    units_by_year = defaultdict(float)
+    # Keyed by (year, product) so each record costs one lookup here; split
+    # into a dictionary per year after the loop
+    units_by_year_product = defaultdict(float)
+    # Summed unit prices and record counts, for the per-group averages
+    price_by_product = defaultdict(float)
+    count_by_product = defaultdict(int)
+    count_by_region = defaultdict(int)
+    
+    for record in records:
+        product = record.product
+        region = record.region
+        month, year = _date_keys(record.date)
+        record_revenue = record.total_revenue
+        record_units = record.units_sold
+        
+        revenue_by_product[product] += record_revenue
+        revenue_by_region[region] += record_revenue
+        revenue_by_month[month] += record_revenue
+        revenue_by_year[year] += record_revenue
+        units_by_product[product] += record_units
+        units_by_region[region] += record_units
+        units_by_month[month] += record_units
+        units_by_year[year] += record_units
+        units_by_year_product[year, product] += record_units
+        price_by_product[product] += record.unit_price
+        count_by_product[product] += 1
+        count_by_region[region] += 1
+    
+    units_by_year_and_product = {}
+    for (year, product), product_units in units_by_year_product.items():
+        units_by_year_and_product.setdefault(year, {})[product] = product_units
+    
+    # max/min with an attrgetter key run in C, so they stay out of the loop
+    most_expensive = least_expensive = ("", 0.0)
+    if records:
+        max_price_record = max(records, key=_price)
+        min_price_record = min(records, key=_price)
+        most_expensive = (max_price_record.product, max_price_record.unit_price)
+        least_expensive = (min_price_record.product, min_price_record.unit_price)
+    
+    result = _Aggregates(
+        dict(revenue_by_product),
+        dict(revenue_by_region),
+        dict(revenue_by_month),
+        dict(revenue_by_year),
+        dict(units_by_product),
+        dict(units_by_region),
+        dict(units_by_month),
+        dict(units_by_year),
+        units_by_year_and_product,
+        dict(price_by_product),
+        dict(count_by_product),
+        dict(count_by_region),
+        most_expensive,
+        least_expensive,
+        # Overall totals use fsum, which does not accumulate rounding
+        # error across many records, and runs in C outside the loop above
+        math.fsum(map(_revenue, records)),
+        math.fsum(map(_units, records))
+    )
+    return result
+
 
 def total_revenue(records: List[SalesRecord]) -> float:
     """
     Calculate total revenue across all sales records.
     
-    Uses functional programming with reduce to sum revenues.
+    Read from the shared single-pass aggregates (see _aggregate).
     
     Args:
         records: List of sales records
@@ -22,14 +213,14 @@ def total_revenue(records: List[SalesRecord]) -> float:
     Returns:
         Total revenue as float
     """
-    return reduce(lambda acc, r: acc + r.total_revenue, records, 0.0)
+    return _aggregate(records).revenue
 
 
 def total_units_sold(records: List[SalesRecord]) -> float:
     """
     Calculate total units sold across all sales records.
     
-    Uses functional programming with reduce to sum units.
+    Read from the shared single-pass aggregates (see _aggregate).
     
     Args:
         records: List of sales records
@@ -37,14 +228,14 @@ def total_units_sold(records: List[SalesRecord]) -> float:
     Returns:
         Total units sold as float
     """
-    return reduce(lambda acc, r: acc + r.units_sold, records, 0.0)
+    return _aggregate(records).units
 
 
 def sales_by_product(records: List[SalesRecord]) -> Dict[str, float]:
     """
     Calculate total revenue grouped by product.
     
-    Uses dictionary comprehension and functional patterns.
+    Read from the shared single-pass aggregates (see _aggregate).
     
     Args:
         records: List of sales records
@@ -52,21 +243,14 @@ def sales_by_product(records: List[SalesRecord]) -> Dict[str, float]:
     Returns:
         Dictionary mapping product names to total revenue
     """
-    # Group by product using defaultdict
-    product_revenue = defaultdict(float)
-    
-    # Use map to extract product and revenue, then aggregate
-    for record in records:
-        product_revenue[record.product] += record.total_revenue
-    
-    return dict(product_revenue)
+    return dict(_aggregate(records).revenue_by_product)
 
 
 def sales_by_region(records: List[SalesRecord]) -> Dict[str, float]:
     """
     Calculate total revenue grouped by region.
     
-    Uses dictionary comprehension and functional patterns.
+    Read from the shared single-pass aggregates (see _aggregate).
     
     Args:
         records: List of sales records
@@ -74,21 +258,15 @@ def sales_by_region(records: List[SalesRecord]) -> Dict[str, float]:
     Returns:
         Dictionary mapping region names to total revenue
     """
-    # Group by region using defaultdict
-    region_revenue = defaultdict(float)
-    
-    # Use map to extract region and revenue, then aggregate
-    for record in records:
-        region_revenue[record.region] += record.total_revenue
-    
-    return dict(region_revenue)
+    return dict(_aggregate(records).revenue_by_region)
 
 
 def average_price_by_product(records: List[SalesRecord]) -> Dict[str, float]:
     """
     Calculate average unit price by product.
     
-    Uses functional programming with map, filter, and comprehensions.
+    Divides the summed prices from the shared single-pass aggregates by
+    the record count, without collecting prices per product.
     
     Args:
         records: List of sales records
@@ -96,16 +274,11 @@ def average_price_by_product(records: List[SalesRecord]) -> Dict[str, float]:
     Returns:
         Dictionary mapping product names to average unit price
     """
-    # Group records by product
-    product_records = defaultdict(list)
-    for record in records:
-        product_records[record.product].append(record)
-    
-    # Calculate average price for each product using functional approach
+    aggregates = _aggregate(records)
+    counts = aggregates.count_by_product
     return {
-        product: sum(map(lambda r: r.unit_price, product_records[product])) 
-                / len(product_records[product])
-        for product in product_records
+        product: price / counts[product]
+        for product, price in aggregates.price_by_product.items()
     }
 
 
@@ -113,7 +286,7 @@ def top_selling_product(records: List[SalesRecord]) -> Tuple[str, float]:
     """
     Find the product with the highest total revenue.
     
-    Uses functional programming with max and lambda expressions.
+    Uses functional programming with max and itemgetter.
     
     Args:
         records: List of sales records
@@ -124,10 +297,10 @@ def top_selling_product(records: List[SalesRecord]) -> Tuple[str, float]:
     if not records:
         return ("", 0.0)
     
-    product_revenue = sales_by_product(records)
+    product_revenue = _aggregate(records).revenue_by_product
     
     # Use max with key function to find top product
-    top_product = max(product_revenue.items(), key=lambda x: x[1])
+    top_product = max(product_revenue.items(), key=_amount)
     
     return top_product
 
@@ -144,30 +317,14 @@ def monthly_sales(records: List[SalesRecord]) -> Dict[str, float]:
     Returns:
         Dictionary mapping month (YYYY-MM) to total revenue
     """
-    # Extract month from date (assumes YYYY-MM-DD format)
-    def extract_month(record: SalesRecord) -> str:
-        """Extract YYYY-MM from date string."""
-        date_parts = record.date.split('-')
-        if len(date_parts) >= 2:
-            return f"{date_parts[0]}-{date_parts[1]}"
-        return record.date[:7] if len(record.date) >= 7 else "Unknown"
-    
-    # Group by month using functional approach
-    monthly_revenue = defaultdict(float)
-    
-    # Use map to extract month and aggregate revenue
-    for record in records:
-        month = extract_month(record)
-        monthly_revenue[month] += record.total_revenue
-    
-    return dict(monthly_revenue)
+    return dict(_aggregate(records).revenue_by_month)
 
 
 def average_revenue_per_transaction(records: List[SalesRecord]) -> float:
     """
     Calculate average revenue per transaction.
     
-    Uses functional programming with reduce and len.
+    Uses functional programming with sum and len.
     
     Args:
         records: List of sales records
@@ -184,7 +341,8 @@ def unique_products_count(records: List[SalesRecord]) -> int:
     """
     Count the number of unique products.
     
-    Uses set comprehension for unique values.
+    Read from the shared single-pass aggregates, which already hold one
+    entry per product.
     
     Args:
         records: List of sales records
@@ -192,14 +350,15 @@ def unique_products_count(records: List[SalesRecord]) -> int:
     Returns:
         Number of unique products
     """
-    return len({record.product for record in records})
+    return len(_aggregate(records).count_by_product)
 
 
 def unique_regions_count(records: List[SalesRecord]) -> int:
     """
     Count the number of unique regions.
     
-    Uses set comprehension for unique values.
+    Read from the shared single-pass aggregates, which already hold one
+    entry per region.
     
     Args:
         records: List of sales records
@@ -207,14 +366,15 @@ def unique_regions_count(records: List[SalesRecord]) -> int:
     Returns:
         Number of unique regions
     """
-    return len({record.region for record in records})
+    return len(_aggregate(records).count_by_region)
 
 
 def top_n_products(records: List[SalesRecord], n: int = 5) -> List[Tuple[str, float]]:
     """
     Find top N products by revenue.
     
-    Uses functional programming with sorted and lambda.
+    Uses heapq.nlargest, which only keeps N candidates instead of sorting
+    every product.
     
     Args:
         records: List of sales records
@@ -223,17 +383,15 @@ def top_n_products(records: List[SalesRecord], n: int = 5) -> List[Tuple[str, fl
     Returns:
         List of tuples (product_name, revenue) sorted by revenue descending
     """
-    product_revenue = sales_by_product(records)
-    # Use sorted with lambda to get top N
-    top_products = sorted(product_revenue.items(), key=lambda x: x[1], reverse=True)
-    return top_products[:n]
+    product_revenue = _aggregate(records).revenue_by_product
+    return heapq.nlargest(n, product_revenue.items(), key=_amount)
 
 
 def best_selling_month(records: List[SalesRecord]) -> Tuple[str, float]:
     """
     Find the month with the highest total revenue.
     
-    Uses functional programming with max and lambda.
+    Uses functional programming with max and itemgetter.
     
     Args:
         records: List of sales records
@@ -244,15 +402,15 @@ def best_selling_month(records: List[SalesRecord]) -> Tuple[str, float]:
     if not records:
         return ("", 0.0)
     
-    monthly = monthly_sales(records)
-    return max(monthly.items(), key=lambda x: x[1])
+    monthly = _aggregate(records).revenue_by_month
+    return max(monthly.items(), key=_amount)
 
 
 def worst_selling_month(records: List[SalesRecord]) -> Tuple[str, float]:
     """
     Find the month with the lowest total revenue.
     
-    Uses functional programming with min and lambda.
+    Uses functional programming with min and itemgetter.
     
     Args:
         records: List of sales records
@@ -263,15 +421,15 @@ def worst_selling_month(records: List[SalesRecord]) -> Tuple[str, float]:
     if not records:
         return ("", 0.0)
     
-    monthly = monthly_sales(records)
-    return min(monthly.items(), key=lambda x: x[1])
+    monthly = _aggregate(records).revenue_by_month
+    return min(monthly.items(), key=_amount)
 
 
 def top_region_by_revenue(records: List[SalesRecord]) -> Tuple[str, float]:
     """
     Find the region with the highest total revenue.
     
-    Uses functional programming with max and lambda.
+    Uses functional programming with max and itemgetter.
     
     Args:
         records: List of sales records
@@ -282,15 +440,15 @@ def top_region_by_revenue(records: List[SalesRecord]) -> Tuple[str, float]:
     if not records:
         return ("", 0.0)
     
-    region_sales = sales_by_region(records)
-    return max(region_sales.items(), key=lambda x: x[1])
+    region_sales = _aggregate(records).revenue_by_region
+    return max(region_sales.items(), key=_amount)
 
 
 def top_region_by_units(records: List[SalesRecord]) -> Tuple[str, float]:
     """
     Find the region with the highest total units sold.
     
-    Uses functional programming with max and lambda.
+    Uses functional programming with max and itemgetter.
     
     Args:
         records: List of sales records
@@ -301,11 +459,8 @@ def top_region_by_units(records: List[SalesRecord]) -> Tuple[str, float]:
     if not records:
         return ("", 0.0)
     
-    region_units = defaultdict(float)
-    for record in records:
-        region_units[record.region] += record.units_sold
-    
-    return max(region_units.items(), key=lambda x: x[1])
+    region_units = _aggregate(records).units_by_region
+    return max(region_units.items(), key=_amount)
 
 
 def average_revenue_per_region(records: List[SalesRecord]) -> Dict[str, float]:
@@ -320,13 +475,11 @@ def average_revenue_per_region(records: List[SalesRecord]) -> Dict[str, float]:
     Returns:
         Dictionary mapping region names to average revenue
     """
-    region_records = defaultdict(list)
-    for record in records:
-        region_records[record.region].append(record.total_revenue)
-    
+    aggregates = _aggregate(records)
+    counts = aggregates.count_by_region
     return {
-        region: sum(revenues) / len(revenues)
-        for region, revenues in region_records.items()
+        region: revenue / counts[region]
+        for region, revenue in aggregates.revenue_by_region.items()
     }
 
 
@@ -334,7 +487,7 @@ def revenue_concentration_top_10_percent(records: List[SalesRecord]) -> float:
     """
     Calculate what percentage of total revenue comes from top 10% of products.
     
-    Uses functional programming with sorted and lambda.
+    Uses heapq.nlargest to pick the top products without a full sort.
     
     Args:
         records: List of sales records
@@ -345,21 +498,18 @@ def revenue_concentration_top_10_percent(records: List[SalesRecord]) -> float:
     if not records:
         return 0.0
     
-    product_revenue = sales_by_product(records)
+    product_revenue = _aggregate(records).revenue_by_product
     total_rev = total_revenue(records)
     
     if total_rev == 0:
         return 0.0
     
-    # Sort products by revenue descending
-    sorted_products = sorted(product_revenue.items(), key=lambda x: x[1], reverse=True)
-    
     # Calculate how many products represent top 10%
-    top_10_percent_count = max(1, len(sorted_products) // 10)
+    top_10_percent_count = max(1, len(product_revenue) // 10)
     
-    # Sum revenue from top 10% products
+    # Sum revenue from top 10% products, largest first
     top_10_percent_revenue = sum(
-        revenue for _, revenue in sorted_products[:top_10_percent_count]
+        heapq.nlargest(top_10_percent_count, product_revenue.values())
     )
     
     return (top_10_percent_revenue / total_rev) * 100
@@ -369,7 +519,7 @@ def peak_sales_period(records: List[SalesRecord]) -> Tuple[str, float]:
     """
     Find the year with the highest total revenue.
     
-    Uses functional programming with max and lambda.
+    Uses functional programming with max and itemgetter.
     
     Args:
         records: List of sales records
@@ -380,8 +530,8 @@ def peak_sales_period(records: List[SalesRecord]) -> Tuple[str, float]:
     if not records:
         return ("", 0.0)
     
-    yearly = yearly_sales(records)
-    return max(yearly.items(), key=lambda x: x[1])
+    yearly = _aggregate(records).revenue_by_year
+    return max(yearly.items(), key=_amount)
 
 
 def average_units_per_region(records: List[SalesRecord]) -> Dict[str, float]:
@@ -396,13 +546,11 @@ def average_units_per_region(records: List[SalesRecord]) -> Dict[str, float]:
     Returns:
         Dictionary mapping region names to average units sold
     """
-    region_records = defaultdict(list)
-    for record in records:
-        region_records[record.region].append(record.units_sold)
-    
+    aggregates = _aggregate(records)
+    counts = aggregates.count_by_region
     return {
-        region: sum(units) / len(units)
-        for region, units in region_records.items()
+        region: units / counts[region]
+        for region, units in aggregates.units_by_region.items()
     }
 
 
@@ -418,17 +566,14 @@ def units_sold_by_product(records: List[SalesRecord]) -> Dict[str, float]:
     Returns:
         Dictionary mapping product names to total units sold
     """
-    product_units = defaultdict(float)
-    for record in records:
-        product_units[record.product] += record.units_sold
-    return dict(product_units)
+    return dict(_aggregate(records).units_by_product)
 
 
 def top_product_by_units(records: List[SalesRecord]) -> Tuple[str, float]:
     """
     Find the product with the highest units sold.
     
-    Uses functional programming with max and lambda.
+    Uses functional programming with max and itemgetter.
     
     Args:
         records: List of sales records
@@ -439,8 +584,8 @@ def top_product_by_units(records: List[SalesRecord]) -> Tuple[str, float]:
     if not records:
         return ("", 0.0)
     
-    product_units = units_sold_by_product(records)
-    top_product = max(product_units.items(), key=lambda x: x[1])
+    product_units = _aggregate(records).units_by_product
+    top_product = max(product_units.items(), key=_amount)
     return top_product
 
 
@@ -448,7 +593,8 @@ def most_expensive_product(records: List[SalesRecord]) -> Tuple[str, float]:
     """
     Find the product with the highest unit price.
     
-    Uses functional programming with max and lambda.
+    Read from the shared single-pass aggregates, which pick it with max
+    and attrgetter.
     
     Args:
         records: List of sales records
@@ -459,16 +605,15 @@ def most_expensive_product(records: List[SalesRecord]) -> Tuple[str, float]:
     if not records:
         return ("", 0.0)
     
-    # Get product with max unit price
-    max_price_record = max(records, key=lambda r: r.unit_price)
-    return (max_price_record.product, max_price_record.unit_price)
+    return _aggregate(records).most_expensive
 
 
 def least_expensive_product(records: List[SalesRecord]) -> Tuple[str, float]:
     """
     Find the product with the lowest unit price.
     
-    Uses functional programming with min and lambda.
+    Read from the shared single-pass aggregates, which pick it with min
+    and attrgetter.
     
     Args:
         records: List of sales records
@@ -479,9 +624,7 @@ def least_expensive_product(records: List[SalesRecord]) -> Tuple[str, float]:
     if not records:
         return ("", 0.0)
     
-    # Get product with min unit price
-    min_price_record = min(records, key=lambda r: r.unit_price)
-    return (min_price_record.product, min_price_record.unit_price)
+    return _aggregate(records).least_expensive
 
 
 def yearly_sales(records: List[SalesRecord]) -> Dict[str, float]:
@@ -496,26 +639,14 @@ def yearly_sales(records: List[SalesRecord]) -> Dict[str, float]:
     Returns:
         Dictionary mapping year (YYYY) to total revenue
     """
-    def extract_year(record: SalesRecord) -> str:
-        """Extract YYYY from date string."""
-        date_parts = record.date.split('-')
-        if len(date_parts) >= 1:
-            return date_parts[0]
-        return record.date[:4] if len(record.date) >= 4 else "Unknown"
-    
-    yearly_revenue = defaultdict(float)
-    for record in records:
-        year = extract_year(record)
-        yearly_revenue[year] += record.total_revenue
-    
-    return dict(yearly_revenue)
+    return dict(_aggregate(records).revenue_by_year)
 
 
 def average_units_per_transaction(records: List[SalesRecord]) -> float:
     """
     Calculate average units sold per transaction.
     
-    Uses functional programming with reduce and len.
+    Uses functional programming with sum and len.
     
     Args:
         records: List of sales records
@@ -540,19 +671,7 @@ def monthly_units_sold(records: List[SalesRecord]) -> Dict[str, float]:
     Returns:
         Dictionary mapping month (YYYY-MM) to total units sold
     """
-    def extract_month(record: SalesRecord) -> str:
-        """Extract YYYY-MM from date string."""
-        date_parts = record.date.split('-')
-        if len(date_parts) >= 2:
-            return f"{date_parts[0]}-{date_parts[1]}"
-        return record.date[:7] if len(record.date) >= 7 else "Unknown"
-    
-    monthly_units = defaultdict(float)
-    for record in records:
-        month = extract_month(record)
-        monthly_units[month] += record.units_sold
-    
-    return dict(monthly_units)
+    return dict(_aggregate(records).units_by_month)
 
 
 def yearly_units_sold(records: List[SalesRecord]) -> Dict[str, float]:
@@ -567,19 +686,7 @@ def yearly_units_sold(records: List[SalesRecord]) -> Dict[str, float]:
     Returns:
         Dictionary mapping year (YYYY) to total units sold
     """
-    def extract_year(record: SalesRecord) -> str:
-        """Extract YYYY from date string."""
-        date_parts = record.date.split('-')
-        if len(date_parts) >= 1:
-            return date_parts[0]
-        return record.date[:4] if len(record.date) >= 4 else "Unknown"
-    
-    yearly_units = defaultdict(float)
-    for record in records:
-        year = extract_year(record)
-        yearly_units[year] += record.units_sold
-    
-    return dict(yearly_units)
+    return dict(_aggregate(records).units_by_year)
 
 
 def units_sold_by_region(records: List[SalesRecord]) -> Dict[str, float]:
@@ -594,17 +701,14 @@ def units_sold_by_region(records: List[SalesRecord]) -> Dict[str, float]:
     Returns:
         Dictionary mapping region names to total units sold
     """
-    region_units = defaultdict(float)
-    for record in records:
-        region_units[record.region] += record.units_sold
-    return dict(region_units)
+    return dict(_aggregate(records).units_by_region)
 
 
 def best_selling_month_by_units(records: List[SalesRecord]) -> Tuple[str, float]:
     """
     Find the month with the highest total units sold.
     
-    Uses functional programming with max and lambda.
+    Uses functional programming with max and itemgetter.
     
     Args:
         records: List of sales records
@@ -615,15 +719,15 @@ def best_selling_month_by_units(records: List[SalesRecord]) -> Tuple[str, float]
     if not records:
         return ("", 0.0)
     
-    monthly = monthly_units_sold(records)
-    return max(monthly.items(), key=lambda x: x[1])
+    monthly = _aggregate(records).units_by_month
+    return max(monthly.items(), key=_amount)
 
 
 def worst_selling_month_by_units(records: List[SalesRecord]) -> Tuple[str, float]:
     """
     Find the month with the lowest total units sold.
     
-    Uses functional programming with min and lambda.
+    Uses functional programming with min and itemgetter.
     
     Args:
         records: List of sales records
@@ -634,15 +738,15 @@ def worst_selling_month_by_units(records: List[SalesRecord]) -> Tuple[str, float
     if not records:
         return ("", 0.0)
     
-    monthly = monthly_units_sold(records)
-    return min(monthly.items(), key=lambda x: x[1])
+    monthly = _aggregate(records).units_by_month
+    return min(monthly.items(), key=_amount)
 
 
 def peak_sales_period_by_units(records: List[SalesRecord]) -> Tuple[str, float]:
     """
     Find the year with the highest total units sold.
     
-    Uses functional programming with max and lambda.
+    Uses functional programming with max and itemgetter.
     
     Args:
         records: List of sales records
@@ -653,15 +757,15 @@ def peak_sales_period_by_units(records: List[SalesRecord]) -> Tuple[str, float]:
     if not records:
         return ("", 0.0)
     
-    yearly = yearly_units_sold(records)
-    return max(yearly.items(), key=lambda x: x[1])
+    yearly = _aggregate(records).units_by_year
+    return max(yearly.items(), key=_amount)
 
 
 def units_concentration_top_10_percent(records: List[SalesRecord]) -> float:
     """
     Calculate what percentage of total units sold comes from top 10% of products.
     
-    Uses functional programming with sorted and lambda.
+    Uses heapq.nlargest to pick the top products without a full sort.
     
     Args:
         records: List of sales records
@@ -672,21 +776,18 @@ def units_concentration_top_10_percent(records: List[SalesRecord]) -> float:
     if not records:
         return 0.0
     
-    product_units = units_sold_by_product(records)
+    product_units = _aggregate(records).units_by_product
     total_units = total_units_sold(records)
     
     if total_units == 0:
         return 0.0
     
-    # Sort products by units descending
-    sorted_products = sorted(product_units.items(), key=lambda x: x[1], reverse=True)
-    
     # Calculate how many products represent top 10%
-    top_10_percent_count = max(1, len(sorted_products) // 10)
+    top_10_percent_count = max(1, len(product_units) // 10)
     
-    # Sum units from top 10% products
+    # Sum units from top 10% products, largest first
     top_10_percent_units = sum(
-        units for _, units in sorted_products[:top_10_percent_count]
+        heapq.nlargest(top_10_percent_count, product_units.values())
     )
     
     return (top_10_percent_units / total_units) * 100
@@ -696,7 +797,8 @@ def top_n_products_by_units(records: List[SalesRecord], n: int = 5) -> List[Tupl
     """
     Find top N products by units sold.
     
-    Uses functional programming with sorted and lambda.
+    Uses heapq.nlargest, which only keeps N candidates instead of sorting
+    every product.
     
     Args:
         records: List of sales records
@@ -705,9 +807,8 @@ def top_n_products_by_units(records: List[SalesRecord], n: int = 5) -> List[Tupl
     Returns:
         List of tuples (product_name, units_sold) sorted by units descending
     """
-    product_units = units_sold_by_product(records)
-    top_products = sorted(product_units.items(), key=lambda x: x[1], reverse=True)
-    return top_products[:n]
+    product_units = _aggregate(records).units_by_product
+    return heapq.nlargest(n, product_units.items(), key=_amount)
 
 
 def top_product_by_year(records: List[SalesRecord]) -> Dict[str, Tuple[str, float]]:
@@ -717,7 +818,7 @@ def top_product_by_year(records: List[SalesRecord]) -> Dict[str, Tuple[str, floa
     Groups sales by year and product, then finds the product with
     the highest units sold for each year.
     
-    Uses functional programming with defaultdict and max.
+    Uses functional programming with max over the year/product grouping.
     
     Args:
         records: List of sales records
@@ -728,27 +829,13 @@ def top_product_by_year(records: List[SalesRecord]) -> Dict[str, Tuple[str, floa
     if not records:
         return {}
     
-    # Extract year from date (assumes YYYY-MM-DD format)
-    def extract_year(record: SalesRecord) -> str:
-        """Extract YYYY from date string."""
-        date_parts = record.date.split('-')
-        if len(date_parts) >= 1:
-            return date_parts[0]
-        return record.date[:4] if len(record.date) >= 4 else "Unknown"
-    
-    # Group units sold by year and product
-    year_product_units = defaultdict(lambda: defaultdict(float))
-    for record in records:
-        year = extract_year(record)
-        year_product_units[year][record.product] += record.units_sold
+    year_product_units = _aggregate(records).units_by_year_and_product
     
-    # Find top product for each year using max with lambda
-    result = {}
-    for year, product_units in year_product_units.items():
-        top_product = max(product_units.items(), key=lambda x: x[1])
-        result[year] = (top_product[0], top_product[1])
-    
-    return result
+    # Find top product for each year using max
+    return {
+        year: max(product_units.items(), key=_amount)
+        for year, product_units in year_product_units.items()
+    }
 
 
 def top_n_products_by_year(records: List[SalesRecord], n: int = 5) -> Dict[str, List[Tuple[str, float]]]:
@@ -758,7 +845,7 @@ def top_n_products_by_year(records: List[SalesRecord], n: int = 5) -> Dict[str,
     Groups sales by year and product, then finds the top N products
     with the highest units sold for each year.
     
-    Uses functional programming with defaultdict, sorted, and lambda.
+    Uses heapq.nlargest over the year/product grouping.
     
     Args:
         records: List of sales records
@@ -770,24 +857,12 @@ def top_n_products_by_year(records: List[SalesRecord], n: int = 5) -> Dict[str,
     if not records:
         return {}
     
-    # Extract year from date (assumes YYYY-MM-DD format)
-    def extract_year(record: SalesRecord) -> str:
-        """Extract YYYY from date string."""
-        date_parts = record.date.split('-')
-        if len(date_parts) >= 1:
-            return date_parts[0]
-        return record.date[:4] if len(record.date) >= 4 else "Unknown"
+    year_product_units = _aggregate(records).units_by_year_and_product
     
-    # Group units sold by year and product
-    year_product_units = defaultdict(lambda: defaultdict(float))
-    for record in records:
-        year = extract_year(record)
-        year_product_units[year][record.product] += record.units_sold
-    
-    # Find top N products for each year using sorted with lambda
+    # Find top N products for each year
     result = {}
     for year, product_units in year_product_units.items():
-        top_products = sorted(product_units.items(), key=lambda x: x[1], reverse=True)[:n]
+        top_products = heapq.nlargest(n, product_units.items(), key=_amount)
         result[year] = top_products
     
     return result
@@ -797,7 +872,8 @@ def bottom_n_products_by_units(records: List[SalesRecord], n: int = 5) -> List[T
     """
     Find bottom N products by units sold.
     
-    Uses functional programming with sorted and lambda.
+    Uses heapq.nsmallest, which only keeps N candidates instead of sorting
+    every product.
     
     Args:
         records: List of sales records
@@ -806,16 +882,15 @@ def bottom_n_products_by_units(records: List[SalesRecord], n: int = 5) -> List[T
     Returns:
         List of tuples (product_name, units_sold) sorted by units ascending
     """
-    product_units = units_sold_by_product(records)
-    bottom_products = sorted(product_units.items(), key=lambda x: x[1])
-    return bottom_products[:n]
+    product_units = _aggregate(records).units_by_product
+    return heapq.nsmallest(n, product_units.items(), key=_amount)
 
 
 def year_over_year_growth(records: List[SalesRecord]) -> Dict[str, float]:
     """
     Calculate year-over-year growth percentage for total units sold.
     
-    Uses functional programming patterns.
+    Uses functional programming with zip and a dict comprehension.
     
     Args:
         records: List of sales records
@@ -823,26 +898,21 @@ def year_over_year_growth(records: List[SalesRecord]) -> Dict[str, float]:
     Returns:
         Dictionary mapping year to growth percentage (previous year as base)
     """
-    yearly = yearly_units_sold(records)
+    # Read the cached totals directly; they are only read here, not copied
+    yearly = _aggregate(records).units_by_year
     if len(yearly) < 2:
         return {}
     
-    sorted_years = sorted(yearly.keys())
-    growth = {}
+    sorted_years = sorted(yearly)
+    sorted_units = [yearly[year] for year in sorted_years]
     
-    for i in range(1, len(sorted_years)):
-        current_year = sorted_years[i]
-        previous_year = sorted_years[i-1]
-        current_units = yearly[current_year]
-        previous_units = yearly[previous_year]
-        
-        if previous_units > 0:
-            growth_pct = ((current_units - previous_units) / previous_units) * 100
-            growth[current_year] = growth_pct
-        else:
-            growth[current_year] = 0.0 if current_units == 0 else 100.0
-    
-    return growth
+    # Pair each year with the one before it using zip instead of indexing
+    return {
+        current_year: ((current_units - previous_units) / previous_units) * 100
+        if previous_units > 0 else (0.0 if current_units == 0 else 100.0)
+        for current_year, previous_units, current_units
+        in zip(sorted_years[1:], sorted_units, sorted_units[1:])
+    }
 
 
 def total_transactions_count(records: List[SalesRecord]) -> int:
@@ -873,7 +943,7 @@ def average_units_per_product(records: List[SalesRecord]) -> float:
     if not records:
         return 0.0
     
-    product_units = units_sold_by_product(records)
+    product_units = _aggregate(records).units_by_product
     if not product_units:
         return 0.0
     
@@ -898,35 +968,19 @@ def products_in_all_years(records: List[SalesRecord]) -> List[str]:
     if not records:
         return []
     
-    def extract_year(record: SalesRecord) -> str:
-        """Extract YYYY from date string."""
-        date_parts = record.date.split('-')
-        if len(date_parts) >= 1:
-            return date_parts[0]
-        return record.date[:4] if len(record.date) >= 4 else "Unknown"
-    
-    # Get all years
-    all_years = {extract_year(r) for r in records}
-    
-    # Get products per year
-    products_by_year = defaultdict(set)
-    for record in records:
-        year = extract_year(record)
-        products_by_year[year].add(record.product)
+    # Products sold in each year are the keys of its per-product totals
+    products_by_year = list(_aggregate(records).units_by_year_and_product.values())
     
     # Find products that appear in all years
-    if not products_by_year:
-        return []
-    
-    common_products = set.intersection(*products_by_year.values())
-    return sorted(list(common_products))
+    common_products = set(products_by_year[0]).intersection(*products_by_year[1:])
+    return sorted(common_products)
 
 
 def top_growth_year(records: List[SalesRecord]) -> Tuple[str, float]:
     """
     Find the year with the highest year-over-year growth.
     
-    Uses functional programming with max and lambda.
+    Uses functional programming with max and itemgetter.
     
     Args:
         records: List of sales records
@@ -938,7 +992,7 @@ def top_growth_year(records: List[SalesRecord]) -> Tuple[str, float]:
     if not growth:
         return ("", 0.0)
     
-    return max(growth.items(), key=lambda x: x[1])
+    return max(growth.items(), key=_amount)
 
 
 def products_by_year_count(records: List[SalesRecord]) -> Dict[str, int]:
@@ -953,17 +1007,8 @@ def products_by_year_count(records: List[SalesRecord]) -> Dict[str, int]:
     Returns:
         Dictionary mapping year to number of unique products
     """
-    def extract_year(record: SalesRecord) -> str:
-        """Extract YYYY from date string."""
-        date_parts = record.date.split('-')
-        if len(date_parts) >= 1:
-            return date_parts[0]
-        return record.date[:4] if len(record.date) >= 4 else "Unknown"
-    
-    products_by_year = defaultdict(set)
-    for record in records:
-        year = extract_year(record)
-        products_by_year[year].add(record.product)
-    
-    return {year: len(products) for year, products in products_by_year.items()}
+    return {
+        year: len(product_units)
+        for year, product_units in _aggregate(records).units_by_year_and_product.items()
+    }
 
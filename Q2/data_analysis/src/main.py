@@ -4,10 +4,13 @@ Orchestrates loading sales data and running all analyses.
 """
 
 import sys
+from itertools import starmap
+from operator import itemgetter
 from pathlib import Path
 
 from reader import load_sales_data
 from analysis import (
+    clear_cache,
     total_units_sold,
     units_sold_by_product,
     units_sold_by_region,
@@ -32,170 +35,188 @@ from analysis import (
 )
 
 
+# Bound formatter for the "name: units" lines printed for every product,
+# region, month and year; the format string is parsed once, not per line
+_format_units_line = "   {}: {:,.0f} units".format
+
+
 def print_analysis_results(records: list) -> None:
     """
     Run all analysis functions and print results to console.
     
+    The analysis functions share one memoized aggregation pass over the
+    records, so calling all of them here walks the records once; this
+    function only orders and formats the results. The cache is cleared
+    once the report is built, or if building it fails, so the records are
+    not kept alive after it.
+    
     Args:
         records: List of sales records to analyze
     """
-    print("=" * 70)
-    print("SALES DATA ANALYSIS RESULTS")
-    print("=" * 70)
-    print()
-    
-    # Total Units Sold
-    print("1. TOTAL UNITS SOLD")
-    print("-" * 70)
-    units = total_units_sold(records)
-    print(f"   Total Units Sold: {units:,.0f}")
-    print()
-    
-    # Units Sold by Product
-    print("2. UNITS SOLD BY PRODUCT")
-    print("-" * 70)
-    units_by_product = units_sold_by_product(records)
-    for product, units in sorted(units_by_product.items(), key=lambda x: x[1], reverse=True):
-        print(f"   {product}: {units:,.0f} units")
-    print()
-    
-    # Units Sold by Region
-    print("3. UNITS SOLD BY REGION")
-    print("-" * 70)
-    units_by_region = units_sold_by_region(records)
-    for region, units in sorted(units_by_region.items(), key=lambda x: x[1], reverse=True):
-        print(f"   {region}: {units:,.0f} units")
-    print()
-    
-    # Top Product by Units
-    print("4. TOP PRODUCT BY UNITS SOLD")
-    print("-" * 70)
-    top_units_product, top_units = top_product_by_units(records)
-    print(f"   Product: {top_units_product}")
-    print(f"   Units Sold: {top_units:,.0f}")
-    print()
-    
-    # Monthly Units Sold
-    print("5. MONTHLY UNITS SOLD")
-    print("-" * 70)
-    monthly = monthly_units_sold(records)
-    for month, units in sorted(monthly.items()):
-        print(f"   {month}: {units:,.0f} units")
-    print()
-    
-    # Yearly Units Sold
-    print("6. YEARLY UNITS SOLD")
-    print("-" * 70)
-    yearly = yearly_units_sold(records)
-    for year, units in sorted(yearly.items()):
-        print(f"   {year}: {units:,.0f} units")
-    print()
-    
-    # Total Car Models
-    print("7. TOTAL CAR MODELS")
-    print("-" * 70)
-    total_models = unique_products_count(records)
-    print(f"   Total Car Models: {total_models}")
-    print()
-    
-    # Top 5 Products by Units (Total)
-    print("8. TOP 5 PRODUCTS BY UNITS SOLD (TOTAL)")
-    print("-" * 70)
-    top_5 = top_n_products_by_units(records, 5)
-    for i, (product, units) in enumerate(top_5, 1):
-        print(f"   {i}. {product}: {units:,.0f} units")
-    print()
-    
-    # Top 5 Products by Year
-    print("9. TOP 5 PRODUCTS BY UNITS SOLD (BY YEAR)")
-    print("-" * 70)
-    top_5_by_year = top_n_products_by_year(records, 5)
-    for year in sorted(top_5_by_year.keys()):
-        print(f"   {year}:")
-        for i, (product, units) in enumerate(top_5_by_year[year], 1):
-            print(f"      {i}. {product}: {units:,.0f} units")
-    print()
-    
-    # Best/Worst Selling Months
-    print("10. BEST AND WORST SELLING MONTHS")
-    print("-" * 70)
-    best_month, best_month_units = best_selling_month_by_units(records)
-    worst_month, worst_month_units = worst_selling_month_by_units(records)
-    print(f"   Best Month: {best_month} ({best_month_units:,.0f} units)")
-    print(f"   Worst Month: {worst_month} ({worst_month_units:,.0f} units)")
-    print()
-    
-    # Units Concentration
-    print("11. UNITS CONCENTRATION")
-    print("-" * 70)
-    concentration = units_concentration_top_10_percent(records)
-    print(f"   Top 10% of Products Account for: {concentration:.2f}% of Total Units Sold")
-    print()
-    
-    # Peak Sales Period
-    print("12. PEAK SALES PERIOD")
-    print("-" * 70)
-    peak_year, peak_year_units = peak_sales_period_by_units(records)
-    print(f"   Peak Year: {peak_year} ({peak_year_units:,.0f} units)")
-    print()
-    
-    # Top Product by Year
-    print("13. TOP-SELLING PRODUCT BY YEAR")
-    print("-" * 70)
-    top_by_year = top_product_by_year(records)
-    for year in sorted(top_by_year.keys()):
-        product, units = top_by_year[year]
-        print(f"   {year}: {product} ({units:,.0f} units)")
-    print()
-    
-    # Year-over-Year Growth
-    print("14. YEAR-OVER-YEAR GROWTH")
-    print("-" * 70)
-    growth = year_over_year_growth(records)
-    for year in sorted(growth.keys()):
-        growth_pct = growth[year]
-        print(f"   {year}: {growth_pct:+.2f}%")
-    print()
-    
-    # Top Growth Year
-    print("15. TOP GROWTH YEAR")
-    print("-" * 70)
-    top_growth_yr, top_growth_pct = top_growth_year(records)
-    if top_growth_yr:
-        print(f"   Year: {top_growth_yr}")
-        print(f"   Growth: {top_growth_pct:+.2f}%")
-    print()
-    
-    # Additional Statistics
-    print("16. ADDITIONAL STATISTICS")
-    print("-" * 70)
-    total_trans = total_transactions_count(records)
-    avg_units_per_prod = average_units_per_product(records)
-    print(f"   Total Transactions: {total_trans:,}")
-    print(f"   Average Units per Product: {avg_units_per_prod:,.2f}")
-    print()
-    
-    # Products in All Years
-    print("17. PRODUCTS SOLD IN ALL YEARS")
-    print("-" * 70)
-    products_all_years = products_in_all_years(records)
-    if products_all_years:
-        for product in products_all_years:
-            print(f"   {product}")
-    else:
-        print("   No products sold in all years")
-    print()
-    
-    # Products Count by Year
-    print("18. NUMBER OF PRODUCTS BY YEAR")
-    print("-" * 70)
-    products_count = products_by_year_count(records)
-    for year in sorted(products_count.keys()):
-        count = products_count[year]
-        print(f"   {year}: {count} products")
-    print()
+    try:
+        # Collect every line and write them in one call at the end, rather
+        # than paying for a print() (and its stdout lock) per line
+        out = []
+        
+        out.append("=" * 70)
+        out.append("SALES DATA ANALYSIS RESULTS")
+        out.append("=" * 70)
+        out.append("")
+        
+        # Total Units Sold
+        out.append("1. TOTAL UNITS SOLD")
+        out.append("-" * 70)
+        units = total_units_sold(records)
+        out.append(f"   Total Units Sold: {units:,.0f}")
+        out.append("")
+        
+        # Units Sold by Product
+        out.append("2. UNITS SOLD BY PRODUCT")
+        out.append("-" * 70)
+        units_by_product = units_sold_by_product(records)
+        out.extend(starmap(_format_units_line, sorted(units_by_product.items(), key=itemgetter(1), reverse=True)))
+        out.append("")
+        
+        # Units Sold by Region
+        out.append("3. UNITS SOLD BY REGION")
+        out.append("-" * 70)
+        units_by_region = units_sold_by_region(records)
+        out.extend(starmap(_format_units_line, sorted(units_by_region.items(), key=itemgetter(1), reverse=True)))
+        out.append("")
+        
+        # Top Product by Units
+        out.append("4. TOP PRODUCT BY UNITS SOLD")
+        out.append("-" * 70)
+        top_units_product, top_units = top_product_by_units(records)
+        out.append(f"   Product: {top_units_product}")
+        out.append(f"   Units Sold: {top_units:,.0f}")
+        out.append("")
+        
+        # Monthly Units Sold
+        out.append("5. MONTHLY UNITS SOLD")
+        out.append("-" * 70)
+        monthly = monthly_units_sold(records)
+        out.extend(starmap(_format_units_line, sorted(monthly.items())))
+        out.append("")
+        
+        # Yearly Units Sold
+        out.append("6. YEARLY UNITS SOLD")
+        out.append("-" * 70)
+        yearly = yearly_units_sold(records)
+        out.extend(starmap(_format_units_line, sorted(yearly.items())))
+        out.append("")
+        
+        # Total Car Models
+        out.append("7. TOTAL CAR MODELS")
+        out.append("-" * 70)
+        total_models = unique_products_count(records)
+        out.append(f"   Total Car Models: {total_models}")
+        out.append("")
+        
+        # Top 5 Products by Units (Total)
+        out.append("8. TOP 5 PRODUCTS BY UNITS SOLD (TOTAL)")
+        out.append("-" * 70)
+        top_5 = top_n_products_by_units(records, 5)
+        for i, (product, units) in enumerate(top_5, 1):
+            out.append(f"   {i}. {product}: {units:,.0f} units")
+        out.append("")
+        
+        # Top 5 Products by Year
+        out.append("9. TOP 5 PRODUCTS BY UNITS SOLD (BY YEAR)")
+        out.append("-" * 70)
+        top_5_by_year = top_n_products_by_year(records, 5)
+        for year in sorted(top_5_by_year.keys()):
+            out.append(f"   {year}:")
+            for i, (product, units) in enumerate(top_5_by_year[year], 1):
+                out.append(f"      {i}. {product}: {units:,.0f} units")
+        out.append("")
+        
+        # Best/Worst Selling Months
+        out.append("10. BEST AND WORST SELLING MONTHS")
+        out.append("-" * 70)
+        best_month, best_month_units = best_selling_month_by_units(records)
+        worst_month, worst_month_units = worst_selling_month_by_units(records)
+        out.append(f"   Best Month: {best_month} ({best_month_units:,.0f} units)")
+        out.append(f"   Worst Month: {worst_month} ({worst_month_units:,.0f} units)")
+        out.append("")
+        
+        # Units Concentration
+        out.append("11. UNITS CONCENTRATION")
+        out.append("-" * 70)
+        concentration = units_concentration_top_10_percent(records)
+        out.append(f"   Top 10% of Products Account for: {concentration:.2f}% of Total Units Sold")
+        out.append("")
+        
+        # Peak Sales Period
+        out.append("12. PEAK SALES PERIOD")
+        out.append("-" * 70)
+        peak_year, peak_year_units = peak_sales_period_by_units(records)
+        out.append(f"   Peak Year: {peak_year} ({peak_year_units:,.0f} units)")
+        out.append("")
+        
+        # Top Product by Year
+        out.append("13. TOP-SELLING PRODUCT BY YEAR")
+        out.append("-" * 70)
+        top_by_year = top_product_by_year(records)
+        for year in sorted(top_by_year.keys()):
+            product, units = top_by_year[year]
+            out.append(f"   {year}: {product} ({units:,.0f} units)")
+        out.append("")
+        
+        # Year-over-Year Growth
+        out.append("14. YEAR-OVER-YEAR GROWTH")
+        out.append("-" * 70)
+        growth = year_over_year_growth(records)
+        for year in sorted(growth.keys()):
+            growth_pct = growth[year]
+            out.append(f"   {year}: {growth_pct:+.2f}%")
+        out.append("")
+        
+        # Top Growth Year
+        out.append("15. TOP GROWTH YEAR")
+        out.append("-" * 70)
+        top_growth_yr, top_growth_pct = top_growth_year(records)
+        if top_growth_yr:
+            out.append(f"   Year: {top_growth_yr}")
+            out.append(f"   Growth: {top_growth_pct:+.2f}%")
+        out.append("")
+        
+        # Additional Statistics
+        out.append("16. ADDITIONAL STATISTICS")
+        out.append("-" * 70)
+        total_trans = total_transactions_count(records)
+        avg_units_per_prod = average_units_per_product(records)
+        out.append(f"   Total Transactions: {total_trans:,}")
+        out.append(f"   Average Units per Product: {avg_units_per_prod:,.2f}")
+        out.append("")
+        
+        # Products in All Years
+        out.append("17. PRODUCTS SOLD IN ALL YEARS")
+        out.append("-" * 70)
+        products_all_years = products_in_all_years(records)
+        if products_all_years:
+            for product in products_all_years:
+                out.append(f"   {product}")
+        else:
+            out.append("   No products sold in all years")
+        out.append("")
+        
+        # Products Count by Year
+        out.append("18. NUMBER OF PRODUCTS BY YEAR")
+        out.append("-" * 70)
+        products_count = products_by_year_count(records)
+        for year in sorted(products_count.keys()):
+            count = products_count[year]
+            out.append(f"   {year}: {count} products")
+        out.append("")
+        
+        out.append("=" * 70)
+    finally:
+        # Let go of the records the analysis cached, even if building
+        # the report failed part-way
+        clear_cache()
     
-    print("=" * 70)
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def main() -> None:
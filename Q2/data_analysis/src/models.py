@@ -4,10 +4,9 @@ Defines the data structure for sales records.
 """
 
 from dataclasses import dataclass
-from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True)
 class SalesRecord:
     """
     Represents a single sales record from the CSV file.
@@ -19,7 +18,17 @@ class SalesRecord:
         units_sold: Number of units sold
         unit_price: Price per unit
         total_revenue: Total revenue (calculated if not provided)
+    
+    Declares __slots__, so a record has no per-instance __dict__: a
+    dataset holds one of these per CSV row, and slots make each record
+    smaller and attribute reads in the analysis loops cheaper.
+    
+    Records are frozen, and so hashable. The analysis module caches
+    results per records list on the understanding that records do not
+    change, and freezing makes that a guarantee rather than a convention.
     """
+    __slots__ = ('date', 'product', 'region', 'units_sold', 'unit_price', 'total_revenue')
+    
     date: str
     product: str
     region: str
@@ -33,5 +42,18 @@ class SalesRecord:
         Ensures total_revenue is always accurate.
         """
         if self.total_revenue == 0 or self.total_revenue is None:
-            self.total_revenue = self.units_sold * self.unit_price
+            # Frozen dataclasses can only set fields through object
+            object.__setattr__(self, 'total_revenue', self.units_sold * self.unit_price)
+    
+    def __reduce__(self):
+        """
+        Pickle a record as a constructor call.
+        
+        The default pickling of slotted objects restores each attribute
+        with setattr, which a frozen dataclass refuses.
+        """
+        return (self.__class__, (
+            self.date, self.product, self.region,
+            self.units_sold, self.unit_price, self.total_revenue
+        ))
 
@@ -5,12 +5,67 @@ Handles loading and parsing sales data from CSV files.
 
 import csv
 import re
-from typing import List, Optional, Dict
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, TextIO, Union
 from pathlib import Path
 
 from models import SalesRecord
 
 
+# A date made of exactly three parts separated by '-' or '/', compiled once
+# so normalize_date does a single match instead of replace() and split()
+_DATE_PARTS_PATTERN = re.compile(r'([^-/]*)[-/]([^-/]*)[-/]([^-/]*)')
+
+# Fields a CSV must map before its rows can be analysed
+_REQUIRED_FIELDS = frozenset(('product', 'unit_price'))
+
+# Accepted column names for each field, most preferred first
+_COLUMN_ALIASES = {
+    'product': ('product', 'product name', 'product_name', 'name'),
+    # Note: 'sales' column might be total revenue, not unit price
+    'unit_price': ('unit_price', 'price', 'sale price', 'sale_price', 'cost', 'price_each', 'price each'),
+    'region': ('region', 'brand', 'location', 'area', 'product_category', 'product category', 'category'),
+    'units_sold': ('units_sold', 'quantity', 'number of ratings', 'number_of_ratings',
+                   'number of reviews', 'number_of_reviews', 'count', 'qty'),
+    'date': ('date', 'sale date', 'sale_date', 'timestamp', 'time', 'order_date', 'order date', 'orderdate'),
+    # Optional - try sales first as it's often total revenue
+    'total_revenue': ('sales', 'total_revenue', 'revenue', 'total', 'amount'),
+}
+
+# Reverse index from each alias to its field and preference rank
+_ALIAS_INDEX = {
+    alias: (field, rank)
+    for field, aliases in _COLUMN_ALIASES.items()
+    for rank, alias in enumerate(aliases)
+}
+
+# Read CSV files in 1 MiB chunks rather than the default 8 KiB, so large
+# files take far fewer read calls
+_READ_BUFFER_SIZE = 1 << 20
+
+# Patterns and month names used by parse_month_column, built once at import
+_YEAR4_PATTERN = re.compile(r'20\d{2}')
+_YEAR2_PATTERN = re.compile(r'\b(\d{2})\b')
+
+# Month name mappings, checked in this order
+_MONTH_NAMES = (
+    ('jan', '01'), ('janv', '01'), ('january', '01'),
+    ('feb', '02'), ('february', '02'),
+    ('mar', '03'), ('mars', '03'), ('march', '03'),
+    ('apr', '04'), ('april', '04'),
+    ('may', '05'),
+    ('jun', '06'), ('juin', '06'), ('june', '06'),
+    ('jul', '07'), ('juil', '07'), ('july', '07'),
+    ('aug', '08'), ('august', '08'),
+    ('sep', '09'), ('sept', '09'), ('september', '09'),
+    ('oct', '10'), ('october', '10'),
+    ('nov', '11'), ('november', '11'),
+    ('dec', '12'), ('december', '12'),
+)
+
+
 def find_column_mapping(headers: List[str]) -> Dict[str, str]:
     """
     Map CSV columns to expected field names using flexible matching.
@@ -24,48 +79,17 @@ def find_column_mapping(headers: List[str]) -> Dict[str, str]:
         Dictionary mapping expected fields to actual column names
     """
     normalized_headers = {col.lower().strip(): col for col in headers}
-    mapping = {}
     
-    # Map product (try: product, product name, product_name, name)
-    for key in ['product', 'product name', 'product_name', 'name']:
-        if key in normalized_headers:
-            mapping['product'] = normalized_headers[key]
-            break
-    
-    # Map unit_price (try: unit_price, price, sale price, sale_price, cost, price_each, price each)
-    # Note: 'sales' column might be total revenue, not unit price
-    for key in ['unit_price', 'price', 'sale price', 'sale_price', 'cost', 'price_each', 'price each']:
-        if key in normalized_headers:
-            mapping['unit_price'] = normalized_headers[key]
-            break
+    # One lookup per header; for each field keep the most preferred alias
+    matches = {}
+    for name, col in normalized_headers.items():
+        alias = _ALIAS_INDEX.get(name)
+        if alias is not None:
+            field, rank = alias
+            if field not in matches or rank < matches[field][0]:
+                matches[field] = (rank, col)
     
-    # Map region (try: region, brand, location, area, product_category, product category, category)
-    for key in ['region', 'brand', 'location', 'area', 'product_category', 'product category', 'category']:
-        if key in normalized_headers:
-            mapping['region'] = normalized_headers[key]
-            break
-    
-    # Map units_sold (try: units_sold, quantity, number of ratings, number_of_ratings, 
-    # number of reviews, number_of_reviews, count, qty)
-    for key in ['units_sold', 'quantity', 'number of ratings', 'number_of_ratings',
-                'number of reviews', 'number_of_reviews', 'count', 'qty']:
-        if key in normalized_headers:
-            mapping['units_sold'] = normalized_headers[key]
-            break
-    
-    # Map date (try: date, sale date, sale_date, timestamp, time, order_date, order date, order date)
-    for key in ['date', 'sale date', 'sale_date', 'timestamp', 'time', 'order_date', 'order date', 'orderdate']:
-        if key in normalized_headers:
-            mapping['date'] = normalized_headers[key]
-            break
-    
-    # Map total_revenue (optional) - try sales first as it's often total revenue
-    for key in ['sales', 'total_revenue', 'revenue', 'total', 'amount']:
-        if key in normalized_headers:
-            mapping['total_revenue'] = normalized_headers[key]
-            break
-    
-    return mapping
+    return {field: matches[field][1] for field in _COLUMN_ALIASES if field in matches}
 
 
 def validate_minimum_columns(mapping: Dict[str, str]) -> bool:
@@ -80,7 +104,7 @@ def validate_minimum_columns(mapping: Dict[str, str]) -> bool:
     Returns:
         True if minimum columns are present
     """
-    return 'product' in mapping and 'unit_price' in mapping
+    return _REQUIRED_FIELDS.issubset(mapping)
 
 
 def parse_float(value: str, default: float = 0.0) -> float:
@@ -94,6 +118,14 @@ def parse_float(value: str, default: float = 0.0) -> float:
     Returns:
         Parsed float value or default
     """
+    # Most cells are plain numbers: float() already ignores surrounding
+    # whitespace, so only strings with thousands separators need cleaning
+    if type(value) is str and ',' not in value:
+        try:
+            return float(value)
+        except ValueError:
+            return default
+    
     try:
         # Remove commas and other formatting
         cleaned = str(value).strip().replace(',', '')
@@ -102,11 +134,15 @@ def parse_float(value: str, default: float = 0.0) -> float:
         return default
 
 
+@lru_cache(maxsize=4096)
 def normalize_date(date_str: str) -> str:
     """
     Normalize date string to YYYY-MM-DD format.
     Handles various date formats including DD-MM-YYYY, MM-DD-YYYY, YYYY-MM-DD.
     
+    Results are cached: a sales file repeats the same few dates across
+    many rows, so most calls are answered without parsing.
+    
     Args:
         date_str: Date string in various formats
         
@@ -118,43 +154,38 @@ def normalize_date(date_str: str) -> str:
     
     date_str = date_str.strip()
     
+    # Dates already in YYYY-MM-DD form need no parsing
+    if len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
+        return date_str
+    
     # Try to parse various date formats
-    if '-' in date_str or '/' in date_str:
-        parts = date_str.replace('/', '-').split('-')
-        if len(parts) == 3:
-            try:
-                # Check if first part is 4 digits (YYYY-MM-DD format)
-                if len(parts[0]) == 4:
-                    # Already in YYYY-MM-DD format
-                    return date_str
-                # Check if third part is 4 digits (DD-MM-YYYY or MM-DD-YYYY)
-                elif len(parts[2]) == 4:
-                    # If first part > 12, it's DD-MM-YYYY
-                    if int(parts[0]) > 12:
-                        day, month, year = parts[0], parts[1], parts[2]
-                        return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-                    else:
-                        # Assume MM-DD-YYYY
-                        month, day, year = parts[0], parts[1], parts[2]
-                        return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-                # Handle 2-digit year (M/D/YY or DD/MM/YY format)
-                elif len(parts[2]) == 2:
-                    # Convert 2-digit year to 4-digit (assume 20XX for years 00-99)
-                    year_2digit = int(parts[2])
-                    year_4digit = 2000 + year_2digit if year_2digit < 100 else year_2digit
-                    # If first part > 12, it's DD-MM-YY
-                    if int(parts[0]) > 12:
-                        day, month = parts[0], parts[1]
-                        return f"{year_4digit}-{month.zfill(2)}-{day.zfill(2)}"
-                    else:
-                        # Assume MM-DD-YY
-                        month, day = parts[0], parts[1]
-                        return f"{year_4digit}-{month.zfill(2)}-{day.zfill(2)}"
-                else:
-                    # Can't determine format, return as is
-                    return date_str
-            except (ValueError, IndexError):
-                pass
+    match = _DATE_PARTS_PATTERN.fullmatch(date_str)
+    if match:
+        first, second, third = match.groups()
+        try:
+            # Check if first part is 4 digits (YYYY-MM-DD format)
+            if len(first) == 4:
+                # Already in YYYY-MM-DD format
+                return date_str
+            # Check if third part is 4 digits (DD-MM-YYYY or MM-DD-YYYY)
+            elif len(third) == 4:
+                year = third
+            # Handle 2-digit year (M/D/YY or DD/MM/YY format)
+            elif len(third) == 2:
+                # Convert 2-digit year to 4-digit (assume 20XX)
+                year = str(2000 + int(third))
+            else:
+                # Can't determine format, return as is
+                return date_str
+            
+            # If first part > 12, it's DD-MM-YYYY; otherwise assume MM-DD-YYYY
+            if int(first) > 12:
+                day, month = first, second
+            else:
+                month, day = first, second
+            return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
+        except ValueError:
+            pass
     
     # If already in YYYY-MM-DD format or can't parse, return as is
     return date_str
@@ -165,6 +196,11 @@ def parse_row(row: dict, mapping: Dict[str, str], row_number: int) -> Optional[S
     Parse a single CSV row into a SalesRecord object.
     Skips malformed rows and returns None if parsing fails.
     
+    The product, region and date strings are interned, so every record
+    with the same value shares one string object. Analysis groups by these
+    fields, and a shared string keeps its hash cached and compares equal
+    by identity.
+    
     Args:
         row: Dictionary representing a CSV row
         mapping: Column mapping dictionary
@@ -182,20 +218,22 @@ def parse_row(row: dict, mapping: Dict[str, str], row_number: int) -> Optional[S
         if not product:
             return None
         
-        # Get unit_price (required)
-        # If we have Sales (total_revenue) and Quantity, calculate unit_price
+        # Parse revenue and units once; both feed the unit_price fallback
+        # below as well as the record itself
         price_col = mapping.get('unit_price')
         revenue_col = mapping.get('total_revenue')
         units_col = mapping.get('units_sold')
+        total_revenue = parse_float(row.get(revenue_col, '0')) if revenue_col else 0.0
+        units = parse_float(row.get(units_col, '1')) if units_col else 1.0
         
+        # Get unit_price (required)
+        # If we have Sales (total_revenue) and Quantity, calculate unit_price
         if price_col:
             unit_price = parse_float(row.get(price_col, '0'))
         elif revenue_col and units_col:
             # Calculate unit_price from total_revenue / units_sold
-            total_rev = parse_float(row.get(revenue_col, '0'))
-            units = parse_float(row.get(units_col, '1'))
             if units > 0:
-                unit_price = total_rev / units
+                unit_price = total_revenue / units
             else:
                 return None
         else:
@@ -212,9 +250,8 @@ def parse_row(row: dict, mapping: Dict[str, str], row_number: int) -> Optional[S
             region = "Unknown"
         
         # Get units_sold (use available data or default to 1)
-        units_col = mapping.get('units_sold')
         if units_col and row.get(units_col):
-            units_sold = parse_float(row.get(units_col, '1'))
+            units_sold = units
             # If units_sold is 0 or negative, default to 1
             if units_sold <= 0:
                 units_sold = 1.0
@@ -234,14 +271,10 @@ def parse_row(row: dict, mapping: Dict[str, str], row_number: int) -> Optional[S
             # Generate a default date based on row number
             date = f"2024-01-{min(28, row_number % 28 + 1):02d}"
         
-        # Get total_revenue (optional, will be calculated if missing)
-        revenue_col = mapping.get('total_revenue')
-        total_revenue = parse_float(row.get(revenue_col, '0')) if revenue_col else 0.0
-        
         return SalesRecord(
-            date=date,
-            product=product,
-            region=region,
+            date=sys.intern(date),
+            product=sys.intern(product),
+            region=sys.intern(region),
             units_sold=units_sold,
             unit_price=unit_price,
             total_revenue=total_revenue
@@ -250,11 +283,15 @@ def parse_row(row: dict, mapping: Dict[str, str], row_number: int) -> Optional[S
         return None
 
 
+@lru_cache(maxsize=1024)
 def parse_month_column(month_str: str) -> Optional[str]:
     """
     Parse month column name to YYYY-MM format.
     Handles various formats like 'janv-12', 'Feb 2012', 'mars-12', etc.
     
+    Results are cached: the same header names are parsed again for every
+    row of a pivot table and by is_pivot_table_format.
+    
     Args:
         month_str: Month column name
         
@@ -263,31 +300,14 @@ def parse_month_column(month_str: str) -> Optional[str]:
     """
     month_str = month_str.strip().lower()
     
-    # Month name mappings
-    month_map = {
-        'jan': '01', 'janv': '01', 'january': '01',
-        'feb': '02', 'february': '02',
-        'mar': '03', 'mars': '03', 'march': '03',
-        'apr': '04', 'april': '04',
-        'may': '05',
-        'jun': '06', 'juin': '06', 'june': '06',
-        'jul': '07', 'juil': '07', 'july': '07',
-        'aug': '08', 'august': '08',
-        'sep': '09', 'sept': '09', 'september': '09',
-        'oct': '10', 'october': '10',
-        'nov': '11', 'november': '11',
-        'dec': '12', 'december': '12'
-    }
-    
     # Try to extract year and month
-    import re
     # Look for 4-digit year
-    year_match = re.search(r'20\d{2}', month_str)
+    year_match = _YEAR4_PATTERN.search(month_str)
     if year_match:
         year = year_match.group()
     else:
         # Look for 2-digit year
-        year_match = re.search(r'\b(\d{2})\b', month_str)
+        year_match = _YEAR2_PATTERN.search(month_str)
         if year_match:
             year_2digit = int(year_match.group(1))
             year = f"20{year_2digit:02d}" if year_2digit < 100 else str(year_2digit)
@@ -296,7 +316,7 @@ def parse_month_column(month_str: str) -> Optional[str]:
     
     # Find month
     month = None
-    for key, value in month_map.items():
+    for key, value in _MONTH_NAMES:
         if key in month_str:
             month = value
             break
@@ -322,10 +342,114 @@ def is_pivot_table_format(headers: List[str]) -> bool:
     normalized = [h.lower().strip() for h in headers]
     
     has_product_cols = any(col in ['make', 'model', 'product', 'name'] for col in normalized)
-    date_like_cols = sum(1 for h in headers if parse_month_column(h) is not None)
+    if not has_product_cols:
+        return False
+    
+    # If we have product columns and many date-like columns, it's likely
+    # pivot format; stop scanning headers once three have been found
+    date_like_cols = 0
+    for h in headers:
+        if parse_month_column(h) is not None:
+            date_like_cols += 1
+            if date_like_cols >= 3:
+                return True
+    return False
+
+
+def _iter_pivot_table(reader: csv.DictReader) -> Iterator[SalesRecord]:
+    """
+    Yield records from a pivot table CSV whose header has been read.
     
-    # If we have product columns and many date-like columns, it's likely pivot format
-    return has_product_cols and date_like_cols >= 3
+    Args:
+        reader: DictReader over the file, positioned after the header row
+        
+    Yields:
+        SalesRecord objects, in file order
+    
+    Raises:
+        ValueError: If the Make or Model column is missing
+    """
+    headers = reader.fieldnames or []
+    
+    # Find product identifier columns
+    normalized_headers = {h.lower().strip(): h for h in headers}
+    make_col = None
+    model_col = None
+    
+    for key in ['make', 'brand']:
+        if key in normalized_headers:
+            make_col = normalized_headers[key]
+            break
+    
+    for key in ['model', 'product', 'name']:
+        if key in normalized_headers:
+            model_col = normalized_headers[key]
+            break
+    
+    if not make_col or not model_col:
+        raise ValueError("Pivot table format requires Make and Model columns")
+    
+    # Work out the date columns once, in header order, together with
+    # the record date for each (day 01), rather than re-checking every
+    # header for every row. Dates are interned so records share them.
+    date_columns = []
+    for col in headers:
+        if col in [make_col, model_col, 'Logo']:
+            continue
+        
+        # Try to parse as date
+        date_str = parse_month_column(col)
+        if date_str:
+            date_columns.append((col, sys.intern(f"{date_str}-01")))
+    
+    # Process each row (each row is a product)
+    for row_num, row in enumerate(reader, start=2):
+        make = str(row.get(make_col, '')).strip()
+        model = str(row.get(model_col, '')).strip()
+        
+        if not make or not model:
+            continue
+        
+        # Interned so records share one string per product, as in
+        # parse_row
+        product = sys.intern(f"{make} {model}")
+        region = "USA"  # Default region for this dataset
+        
+        # Process each date column
+        prev_value = 0.0
+        for col, date in date_columns:
+            # Get value for this month
+            value_str = row.get(col, '').strip()
+            if not value_str or value_str == '':
+                continue
+            
+            # Parse value (handle comma-separated numbers)
+            try:
+                value = parse_float(value_str)
+                if value <= 0:
+                    continue
+                
+                # Calculate incremental units (current - previous)
+                # If value is less than previous, use the value as-is (might be reset)
+                units_sold = max(0, value - prev_value) if value >= prev_value else value
+                prev_value = value
+                
+                # Use a default unit price (since not provided)
+                # Could be calculated from average or set to 1
+                unit_price = 1.0  # Default since price not available
+                total_revenue = units_sold * unit_price
+                
+            except (ValueError, TypeError):
+                continue
+            
+            yield SalesRecord(
+                date=date,
+                product=product,
+                region=region,
+                units_sold=units_sold,
+                unit_price=unit_price,
+                total_revenue=total_revenue
+            )
 
 
 def load_pivot_table_data(csv_path: str) -> List[SalesRecord]:
@@ -338,101 +462,111 @@ def load_pivot_table_data(csv_path: str) -> List[SalesRecord]:
     Returns:
         List of SalesRecord objects
     """
-    records: List[SalesRecord] = []
+    with open(csv_path, 'r', encoding='utf-8', newline='', buffering=_READ_BUFFER_SIZE) as file:
+        return list(_iter_pivot_table(csv.DictReader(file)))
+
+
+def _iter_csv_records(file: TextIO) -> Iterator[SalesRecord]:
+    """
+    Yield records from an open sales CSV, starting at its header row.
     
-    with open(csv_path, 'r', encoding='utf-8') as file:
-        reader = csv.DictReader(file)
-        headers = reader.fieldnames or []
+    Args:
+        file: Text file positioned at the header row
         
-        # Find product identifier columns
-        normalized_headers = {h.lower().strip(): h for h in headers}
-        make_col = None
-        model_col = None
+    Yields:
+        SalesRecord objects, in file order
         
-        for key in ['make', 'brand']:
-            if key in normalized_headers:
-                make_col = normalized_headers[key]
-                break
+    Raises:
+        ValueError: If CSV is missing minimum required columns
+    """
+    # After the header has been checked, the same reader goes on to the
+    # rows of a standard-format file
+    rows = csv.reader(file)
+    headers = next(rows, None) or []
+    
+    if not headers:
+        raise ValueError("CSV file appears to be empty or has no headers")
+    
+    # Check if pivot table format; if so, keep reading the same file
+    if is_pivot_table_format(headers):
+        yield from _iter_pivot_table(csv.DictReader(file, fieldnames=headers))
+        return
+    
+    # Create flexible column mapping
+    mapping = find_column_mapping(headers)
+    
+    if not validate_minimum_columns(mapping):
+        raise ValueError(
+            f"CSV missing minimum required columns. Need at least: product and price. "
+            f"Found columns: {headers}"
+        )
+    
+    # Rows are read as lists and parse_row gets a dict of just the mapped
+    # columns, instead of a dict of every column as csv.DictReader builds.
+    # As with DictReader, the last of several same-named columns wins and
+    # cells missing from a short row read as None.
+    column_index = {name: index for index, name in enumerate(headers)}
+    columns = [(col, column_index[col]) for col in set(mapping.values())]
+    width = max(index for _, index in columns) + 1
+    
+    # Process each row, skipping None values (malformed rows). Empty lines
+    # are skipped without being counted, as DictReader does.
+    for row_num, row in enumerate(filter(None, rows), start=2):  # Start at 2 (row 1 is header)
+        if len(row) < width:
+            row += [None] * (width - len(row))
+        record = parse_row({col: row[index] for col, index in columns}, mapping, row_num)
+        if record is not None:
+            yield record
+
+
+def iter_sales_data(csv_path: Union[str, TextIO]) -> Iterator[SalesRecord]:
+    """
+    Stream sales records from a CSV file one at a time.
+    
+    Reads the same formats as load_sales_data, with the same validation,
+    but never holds more than one row in memory: callers that aggregate
+    as they go can process files far larger than would fit as a list.
+    A file opened from a path stays open until the generator is
+    exhausted or closed.
+    
+    Args:
+        csv_path: Path to the CSV file, or an already open text file
+            (such as io.StringIO), which is read but not closed
         
-        for key in ['model', 'product', 'name']:
-            if key in normalized_headers:
-                model_col = normalized_headers[key]
-                break
+    Yields:
+        SalesRecord objects, in file order
         
-        if not make_col or not model_col:
-            raise ValueError("Pivot table format requires Make and Model columns")
+    Raises:
+        FileNotFoundError: If CSV file doesn't exist
+        ValueError: If CSV is missing minimum required columns
         
-        # Process each row (each row is a product)
-        for row_num, row in enumerate(reader, start=2):
-            make = str(row.get(make_col, '')).strip()
-            model = str(row.get(model_col, '')).strip()
-            
-            if not make or not model:
-                continue
-            
-            product = f"{make} {model}"
-            region = "USA"  # Default region for this dataset
-            
-            # Process each date column
-            prev_value = 0.0
-            for col in headers:
-                if col in [make_col, model_col, 'Logo']:
-                    continue
-                
-                # Try to parse as date
-                date_str = parse_month_column(col)
-                if not date_str:
-                    continue
-                
-                # Get value for this month
-                value_str = row.get(col, '').strip()
-                if not value_str or value_str == '':
-                    continue
-                
-                # Parse value (handle comma-separated numbers)
-                try:
-                    value = parse_float(value_str)
-                    if value <= 0:
-                        continue
-                    
-                    # Calculate incremental units (current - previous)
-                    # If value is less than previous, use the value as-is (might be reset)
-                    units_sold = max(0, value - prev_value) if value >= prev_value else value
-                    prev_value = value
-                    
-                    # Use a default unit price (since not provided)
-                    # Could be calculated from average or set to 1
-                    unit_price = 1.0  # Default since price not available
-                    total_revenue = units_sold * unit_price
-                    
-                    # Create date with day 01
-                    date = f"{date_str}-01"
-                    
-                    record = SalesRecord(
-                        date=date,
-                        product=product,
-                        region=region,
-                        units_sold=units_sold,
-                        unit_price=unit_price,
-                        total_revenue=total_revenue
-                    )
-                    records.append(record)
-                except (ValueError, TypeError):
-                    continue
+    Errors are raised when iteration starts, not when this is called.
+    """
+    if hasattr(csv_path, 'read'):
+        yield from _iter_csv_records(csv_path)
+        return
     
-    return records
+    file_path = Path(csv_path)
+    
+    if not file_path.exists():
+        raise FileNotFoundError(f"CSV file not found: {csv_path}")
+    
+    with open(file_path, 'r', encoding='utf-8', newline='', buffering=_READ_BUFFER_SIZE) as file:
+        yield from _iter_csv_records(file)
 
 
-def load_sales_data(csv_path: str) -> List[SalesRecord]:
+def load_sales_data(csv_path: Union[str, TextIO]) -> List[SalesRecord]:
     """
     Load sales data from a CSV file.
     
     Validates required columns, skips malformed rows, and converts
     data to SalesRecord objects. Handles various CSV formats flexibly.
     Automatically detects pivot table format and handles it appropriately.
+    See iter_sales_data to stream records instead of loading them all.
     
     Args:
-        csv_path: Path to the CSV file
+        csv_path: Path to the CSV file, or an already open text file
+            (such as io.StringIO), which is read but not closed
         
     Returns:
         List of SalesRecord objects
@@ -441,43 +575,37 @@ def load_sales_data(csv_path: str) -> List[SalesRecord]:
         FileNotFoundError: If CSV file doesn't exist
         ValueError: If CSV is missing minimum required columns
     """
-    file_path = Path(csv_path)
+    return list(iter_sales_data(csv_path))
+
+
+def load_sales_data_many(csv_paths: List[str], max_workers: Optional[int] = None) -> List[SalesRecord]:
+    """
+    Load sales data from several CSV files, parsing them in parallel.
     
-    if not file_path.exists():
-        raise FileNotFoundError(f"CSV file not found: {csv_path}")
+    Each file is loaded with load_sales_data in a separate worker
+    process; parsing is CPU-bound Python, so threads would not overlap.
+    A single file is loaded in this process, without starting a pool.
     
-    # First, check if it's pivot table format
-    with open(file_path, 'r', encoding='utf-8') as file:
-        reader = csv.DictReader(file)
-        headers = reader.fieldnames or []
+    Args:
+        csv_paths: Paths to the CSV files
+        max_workers: Maximum number of worker processes (defaults to the
+            number of CPUs)
         
-        if not headers:
-            raise ValueError("CSV file appears to be empty or has no headers")
+    Returns:
+        List of SalesRecord objects from all files, in the order of
+        csv_paths
         
-        # Check if pivot table format
-        if is_pivot_table_format(headers):
-            return load_pivot_table_data(csv_path)
+    Raises:
+        FileNotFoundError: If a CSV file doesn't exist
+        ValueError: If a CSV is missing minimum required columns
+    """
+    csv_paths = list(csv_paths)
+    if len(csv_paths) <= 1:
+        return [record for csv_path in csv_paths for record in load_sales_data(csv_path)]
     
-    # Standard format processing
     records: List[SalesRecord] = []
-    
-    with open(file_path, 'r', encoding='utf-8') as file:
-        reader = csv.DictReader(file)
-        headers = reader.fieldnames or []
-        
-        # Create flexible column mapping
-        mapping = find_column_mapping(headers)
-        
-        if not validate_minimum_columns(mapping):
-            raise ValueError(
-                f"CSV missing minimum required columns. Need at least: product and price. "
-                f"Found columns: {headers}"
-            )
-        
-        # Process each row, filtering out None values (malformed rows)
-        for row_num, row in enumerate(reader, start=2):  # Start at 2 (row 1 is header)
-            record = parse_row(row, mapping, row_num)
-            if record is not None:
-                records.append(record)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for file_records in executor.map(load_sales_data, csv_paths):
+            records.extend(file_records)
     
     return records